@@ -0,0 +1,57 @@
+""" Compares the heap strategies of data_structures.queues on a Dijkstra trace and a scheduler trace
+
+Usage: python -m benchmarks.heap_strategies [number_of_nodes] [number_of_edges]
+"""
+import random
+import sys
+import time
+
+from data_structures.graphs.algorithms import dijkstra_shortest_path
+from data_structures.graphs.csr import CSRGraph
+from data_structures.queues.bucket_queue import BucketQueue
+from data_structures.queues.priority_queue import HEAP_STRATEGIES
+
+
+def timed(function, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def dijkstra_trace(number_of_nodes: int, number_of_edges: int, seed: int = 0) -> CSRGraph:
+    """ Random graph with small integer weights, so BucketQueue can take part """
+    rng = random.Random(seed)
+    return CSRGraph.from_edges(number_of_nodes,
+                               [rng.randrange(number_of_nodes) for _ in range(number_of_edges)],
+                               [rng.randrange(number_of_nodes) for _ in range(number_of_edges)],
+                               [rng.randint(1, 100) for _ in range(number_of_edges)])
+
+
+def run_scheduler_trace(queue_class: type, number_of_operations: int, seed: int = 0) -> None:
+    """ Long lived scheduler: jobs are pushed, reprioritised often and popped in between """
+    rng = random.Random(seed)
+    queue = queue_class()
+    for job in range(number_of_operations):
+        queue.push(job, rng.randrange(1000))
+        for _ in range(3):
+            queue.push(rng.randrange(job + 1), rng.randrange(1000))
+        if job % 2:
+            queue.pop()
+
+
+def main() -> None:
+    number_of_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    number_of_edges = int(sys.argv[2]) if len(sys.argv) > 2 else 600000
+    graph = dijkstra_trace(number_of_nodes, number_of_edges)
+    strategies = dict(HEAP_STRATEGIES)
+    strategies['bucket'] = BucketQueue
+
+    print("{0:<10} {1:>12} {2:>12}".format("strategy", "dijkstra (s)", "scheduler (s)"))
+    for name, queue_class in strategies.items():
+        dijkstra_time = timed(dijkstra_shortest_path, graph, 0, queue_class=queue_class)
+        scheduler_time = timed(run_scheduler_trace, queue_class, number_of_nodes)
+        print("{0:<10} {1:>12.3f} {2:>12.3f}".format(name, dijkstra_time, scheduler_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+import sys
+from typing import Any, Callable, Dict, Hashable
+
+from data_structures.linked_lists.doubly_linked_list import DoublyLinkedList, DoublyLinkedNode
+
+_MISSING = object()
+
+
+class LRUCache(object):
+    """ Least recently used cache bounded by number of entries and/or bytes
+
+        A dict maps every key to its node in a DoublyLinkedList ordered from most to least recently used, whose
+        values are (key, value, size) tuples. Hits move the node to the front and evictions pop the tail, so every
+        operation is O(1). Sizes are only measured when max_bytes is set.
+
+        Interface:
+            * get/put
+            * pop
+            * hits/misses/evictions counters
+    """
+
+    def __init__(self, max_size: int = None, max_bytes: int = None,
+                 sizeof: Callable[[Any], int] = sys.getsizeof) -> None:
+        """ Constructor
+
+        :param max_size: Maximum number of entries, None for unbounded
+        :param max_bytes: Maximum total size of the values, None for unbounded
+        :param sizeof: Measures the size of a value in bytes
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.current_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._nodes = dict()  # type: Dict[Hashable, DoublyLinkedNode]
+        self._recency = DoublyLinkedList()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """ Checks for a key without counting a hit or a miss, or refreshing it """
+        return key in self._nodes
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """ Looks a key up, marking it as the most recently used on a hit
+
+        :param key: Key to look up
+        :param default: Returned on a miss
+        :return: Returns the cached value or default
+        """
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._recency.move_to_front(node)
+        return node.value[1]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """ Caches a value as the most recently used one, evicting the least recently used ones until it fits
+
+        A value bigger than max_bytes on its own isn't cached, and drops any previous value of its key.
+
+        :param key: Key of the value
+        :param value: Value to cache
+        """
+        size = 0 if self.max_bytes is None else self.sizeof(value)
+        node = self._nodes.get(key)
+        if node is not None:
+            self.current_bytes -= node.value[2]
+            if self.max_bytes is not None and size > self.max_bytes:
+                del self._nodes[key]
+                self._recency.remove(node)
+                return
+            node.value = (key, value, size)
+            self._recency.move_to_front(node)
+        else:
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._nodes[key] = self._recency.push((key, value, size))
+        self.current_bytes += size
+        self._evict()
+
+    __setitem__ = put
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """ Removes a key
+
+        Raise KeyError if the key isn't cached and no default is given
+
+        :param key: Key to remove
+        :param default: Returned when the key isn't cached
+        :return: Returns the removed value
+        """
+        node = self._nodes.pop(key, None)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        _, value, size = self._recency.remove(node)
+        self.current_bytes -= size
+        return value
+
+    def __delitem__(self, key: Hashable) -> None:
+        self.pop(key)
+
+    def _evict(self) -> None:
+        nodes, recency = self._nodes, self._recency
+        while (self.max_size is not None and len(nodes) > self.max_size) or \
+                (self.max_bytes is not None and self.current_bytes > self.max_bytes):
+            key, _, size = recency.pop_tail()
+            del nodes[key]
+            self.current_bytes -= size
+            self.evictions += 1
@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from data_structures.caches.lru_cache import LRUCache
+
+
+class TestLRUCache(TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache["b"] = 2
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert "b" not in cache
+        assert cache.get("b") is None
+        assert cache["c"] == 3
+        with self.assertRaises(KeyError):
+            cache["d"]
+        assert (cache.hits, cache.misses, cache.evictions) == (2, 2, 1)
+        assert cache.pop("a") == 1
+        assert len(cache) == 1
+
+    def test_byte_bound(self):
+        cache = LRUCache(max_bytes=10, sizeof=len)
+        cache.put("a", "xxxx")
+        cache.put("b", "xxxx")
+        cache.put("a", "xxxxxx")
+        assert cache.current_bytes == 10
+        cache.put("c", "x")
+        assert "b" not in cache and cache.current_bytes == 7
+        # Too big to ever fit, drops the old value of the key
+        cache.put("a", "x" * 11)
+        assert "a" not in cache and cache.current_bytes == 1
+        assert cache.evictions == 1
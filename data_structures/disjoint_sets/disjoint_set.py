@@ -0,0 +1,99 @@
+from array import array
+from typing import Iterable, List, Tuple
+
+INDEX_TYPECODE = 'q'
+RANK_TYPECODE = 'B'  # Ranks are bounded by log2(n), so a byte is plenty
+
+
+class DisjointSet(object):
+    """ Union-Find over the elements 0..n-1
+
+    Uses path compression in find and union by rank, so any sequence of m operations takes O(m * alpha(n)),
+    where alpha is the inverse Ackermann function. Parents and ranks live in typed arrays.
+
+    Interface:
+        DisjointSet(size) -> constructor, every element starts in its own set
+        find(x) -> representative of the set of x
+        union(x, y) -> joins the sets of x and y
+        connected(x, y) -> whether x and y are in the same set
+        find_many(elements) / union_many(pairs) -> batch versions
+        labels() -> representative of every element
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        """ Constructor
+
+        :param size: Number of elements
+        """
+        self._parents = array(INDEX_TYPECODE, range(size))
+        self._ranks = array(RANK_TYPECODE, bytes(size))
+        self.number_of_sets = size
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def find(self, x: int) -> int:
+        """ Finds the representative of the set of x
+
+        Two passes: the first walks up to the root, the second points every node on the way straight at it
+
+        :param x: Element
+        :return: Returns the representative of the set of x
+        """
+        parents = self._parents
+        root = x
+        while parents[root] != root:
+            root = parents[root]
+        while parents[x] != root:
+            parents[x], x = root, parents[x]
+        return root
+
+    def union(self, x: int, y: int) -> bool:
+        """ Joins the sets of x and y, the root with the lower rank is linked under the other one
+
+        :param x: First element to join
+        :param y: Second element to join
+        :return: Returns True if x and y were in different sets
+        """
+        x_root = self.find(x)
+        y_root = self.find(y)
+        if x_root == y_root:
+            return False
+
+        ranks = self._ranks
+        if ranks[x_root] < ranks[y_root]:
+            x_root, y_root = y_root, x_root
+        self._parents[y_root] = x_root
+        if ranks[x_root] == ranks[y_root]:
+            ranks[x_root] += 1
+        self.number_of_sets -= 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def find_many(self, elements: Iterable[int]) -> List[int]:
+        """ Finds the representative of every element
+
+        :param elements: Elements
+        :return: Returns the list of representatives
+        """
+        find = self.find
+        return [find(x) for x in elements]
+
+    def union_many(self, pairs: Iterable[Tuple[int, int]]) -> int:
+        """ Joins the sets of every (x, y) pair, use ``zip(xs, ys)`` for parallel arrays
+
+        :param pairs: Iterable of (x, y) pairs
+        :return: Returns the number of unions that joined two different sets
+        """
+        union = self.union
+        return sum(union(x, y) for x, y in pairs)
+
+    def labels(self) -> List[int]:
+        """ Labels every element with its representative, which is a connected component labelling when the
+        unions were the edges of a graph
+
+        :return: Returns a list that maps every element to its representative
+        """
+        return self.find_many(range(len(self)))
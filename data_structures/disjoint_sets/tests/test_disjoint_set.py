@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from data_structures.disjoint_sets.disjoint_set import DisjointSet
+
+
+class TestDisjointSet(TestCase):
+    def test_union_find(self):
+        subsets = DisjointSet(5)
+        assert subsets.number_of_sets == 5
+        assert subsets.union(0, 1) is True
+        assert subsets.union(3, 4) is True
+        assert subsets.union(1, 0) is False
+        assert subsets.connected(0, 1)
+        assert not subsets.connected(1, 3)
+        assert subsets.number_of_sets == 3
+
+    def test_path_compression(self):
+        subsets = DisjointSet(100000)
+        # Linking in a chain would recurse/walk linearly without rank and compression
+        for node in range(99999):
+            subsets.union(node, node + 1)
+        assert subsets.number_of_sets == 1
+        root = subsets.find(0)
+        assert all(parent == root for parent in subsets.labels())
+
+    def test_batch_operations(self):
+        subsets = DisjointSet(6)
+        assert subsets.union_many(zip([0, 1, 3, 2], [1, 2, 4, 0])) == 3
+        labels = subsets.find_many(range(6))
+        assert labels[0] == labels[1] == labels[2]
+        assert labels[3] == labels[4]
+        assert len(set(labels)) == 3
@@ -1,45 +1,371 @@
 from math import inf
-from typing import List
+from typing import List, Tuple, Any, Dict, Optional, Callable, Type
 
-from data_structures.graphs.base import Graph
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, only the vectorized algorithms need it
+    np = None
+
+from data_structures.graphs.base import BaseGraph, Edge
+from data_structures.graphs.csr import CSRGraph
 from data_structures.queues.priority_queue import MinHeap
 
 
-def dijkstra_shortest_path(graph_object: Graph, start_node: int) -> List[float]:
+def dijkstra_shortest_path(graph_object: BaseGraph, start_node: int,
+                           queue_class: Type = MinHeap) -> List[float]:
     """ Computes the dijkstra's shortest path algorithm
 
-    :param graph_object:
+    :param graph_object: Either an adjacency list Graph or a frozen CSRGraph
     :param start_node:
+    :param queue_class: Priority queue to use, e.g. BucketQueue when weights are small non negative integers
     :return: Returns a list that maps indexes to distance
     """
 
-    def init_distance(g: Graph, s: int) -> List[float]:
+    def init_distance(g: BaseGraph, s: int) -> List[float]:
         d = [inf] * len(g)  # type: List[float]
         d[s] = 0.0
         return d
 
-    # Assign a key value to all vertices in the input graph.
-    # Initial value is inf for all but the first one
+    # Only the start node is queued up front, the others are pushed lazily when they are first reached
     distance = init_distance(graph_object, start_node)
-    priority_queue = MinHeap.build([(i, priority) for i, priority in enumerate(distance)])
+    priority_queue = queue_class()
+    priority_queue.push(item=start_node, priority=0.0)
+
+    if isinstance(graph_object, CSRGraph):
+        _relax_csr(graph_object, distance, priority_queue)
+        return distance
 
     while priority_queue:  # Priority queue has O(V) elements
         min_index = priority_queue.pop()  # O(log(V))
-        for edge in graph_object.graph[min_index]:  # A graph has at most 2E Edges in adjacency list, so O(E)
+        for edge in graph_object.edges(min_index):  # A graph has at most 2E Edges in adjacency list, so O(E)
             source, destination, edge_weight = edge
-            if priority_queue.contains_item(destination) and distance[source] + edge_weight < distance[destination]:
-                distance[destination] = distance[source] + edge_weight
-                priority_queue.push(item=destination, priority=edge_weight)  # O(log(V))
+            new_distance = distance[source] + edge_weight
+            # With non negative weights a settled node can't be improved, so it is never pushed again
+            if new_distance < distance[destination]:
+                distance[destination] = new_distance
+                priority_queue.push(item=destination, priority=new_distance)  # O(log(V))
 
     return distance
 
 
-def floyd_warshall(adjacency_matrix):
+def _relax_csr(graph_object: CSRGraph, distance: List[float], priority_queue: Any) -> None:
+    """ Main loop of ''dijkstra_shortest_path'' indexing the CSR arrays directly, no edge tuple is ever built """
+    offsets, destinations, weights = graph_object.offsets, graph_object.destinations, graph_object.weights
+    push, pop = priority_queue.push, priority_queue.pop
+    while priority_queue:
+        node = pop()
+        node_distance = distance[node]
+        for index in range(offsets[node], offsets[node + 1]):
+            new_distance = node_distance + weights[index]
+            destination = destinations[index]
+            if new_distance < distance[destination]:
+                distance[destination] = new_distance
+                push(destination, new_distance)
+
+
+def _unwind_path(parents: Dict[int, Optional[int]], node: int) -> List[int]:
+    """ Follows the parents map back from node and returns the path that ends in node """
+    path = list()  # type: List[int]
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
+
+
+def shortest_path(graph_object: BaseGraph, source: int, target: int, heuristic: Callable[[int], float] = None,
+                  queue_class: Type = MinHeap) -> Tuple[float, List[int]]:
+    """ Computes the shortest path between two nodes, stopping as soon as the target is settled
+
+    Nodes are pushed lazily and tracked in dicts, so a query only pays for the part of the graph it explores.
+    Given a heuristic this is A*: nodes are popped by distance + heuristic(node). The heuristic must never
+    overestimate the remaining distance to target, and should be consistent for A* to settle each node once.
+
+    :param graph_object: Either an adjacency list Graph or a frozen CSRGraph
+    :param source: First node of the path
+    :param target: Last node of the path
+    :param heuristic: Optional lower bound of the distance from a node to target
+    :param queue_class: Priority queue to use, e.g. BucketQueue when weights are small non negative integers
+    :return: Returns the (distance, path) pair, (inf, []) if target can't be reached
+    """
+    distance = {source: 0.0}  # type: Dict[int, float]
+    parents = {source: None}  # type: Dict[int, Optional[int]]
+    priority_queue = queue_class()
+    priority_queue.push(item=source, priority=heuristic(source) if heuristic else 0.0)
+
+    while priority_queue:
+        node = priority_queue.pop()
+        if node == target:
+            return distance[target], _unwind_path(parents, target)
+        node_distance = distance[node]
+        for _, destination, edge_weight in graph_object.edges(node):
+            new_distance = node_distance + edge_weight
+            if new_distance < distance.get(destination, inf):
+                distance[destination] = new_distance
+                parents[destination] = node
+                priority = new_distance + heuristic(destination) if heuristic else new_distance
+                priority_queue.push(item=destination, priority=priority)
+
+    return inf, []
+
+
+def a_star_shortest_path(graph_object: BaseGraph, source: int, target: int,
+                         heuristic: Callable[[int], float]) -> Tuple[float, List[int]]:
+    """ Computes the shortest path between two nodes with A*
+
+    .. seealso:: ''shortest_path''
+
+    :param graph_object: Either an adjacency list Graph or a frozen CSRGraph
+    :param source: First node of the path
+    :param target: Last node of the path
+    :param heuristic: Lower bound of the distance from a node to target
+    :return: Returns the (distance, path) pair, (inf, []) if target can't be reached
+    """
+    return shortest_path(graph_object, source, target, heuristic=heuristic)
+
+
+def bidirectional_shortest_path(graph_object: BaseGraph, source: int, target: int, reverse_graph: BaseGraph = None,
+                                queue_class: Type = MinHeap) -> Tuple[float, List[int]]:
+    """ Computes the shortest path between two nodes with bidirectional Dijkstra
+
+    One search grows from source on the graph and another from target on the reversed graph, always expanding
+    the smaller frontier. ``best`` is the shortest source -> target path seen through an edge joining both
+    searches, and the search stops once the two frontier minimums add up to at least ``best``.
+
+    :param graph_object: Either an adjacency list Graph or a frozen CSRGraph
+    :param source: First node of the path
+    :param target: Last node of the path
+    :param reverse_graph: graph_object.reverse(), pass it in to reuse it across queries
+    :param queue_class: Priority queue to use, e.g. BucketQueue when weights are small non negative integers
+    :return: Returns the (distance, path) pair, (inf, []) if target can't be reached
+    """
+    if source == target:
+        return 0.0, [source]
+    if reverse_graph is None:
+        reverse_graph = graph_object.reverse()
+
+    forward = (graph_object, {source: 0.0}, {source: None}, queue_class())
+    backward = (reverse_graph, {target: 0.0}, {target: None}, queue_class())
+    forward[3].push(item=source, priority=0.0)
+    backward[3].push(item=target, priority=0.0)
+
+    best = inf
+    meeting_node = None
+    forward_queue, backward_queue = forward[3], backward[3]
+    while forward_queue and backward_queue:
+        forward_distance, backward_distance = forward[1], backward[1]
+        if forward_distance[forward_queue.peek()] + backward_distance[backward_queue.peek()] >= best:
+            break
+
+        # Expand the side with the smaller frontier
+        if len(forward_queue) <= len(backward_queue):
+            graph, distance, parents, priority_queue = forward
+            other_distance = backward_distance
+        else:
+            graph, distance, parents, priority_queue = backward
+            other_distance = forward_distance
+
+        node = priority_queue.pop()
+        node_distance = distance[node]
+        for _, destination, edge_weight in graph.edges(node):
+            new_distance = node_distance + edge_weight
+            if new_distance < distance.get(destination, inf):
+                distance[destination] = new_distance
+                parents[destination] = node
+                priority_queue.push(item=destination, priority=new_distance)
+            if destination in other_distance and new_distance + other_distance[destination] < best:
+                best = new_distance + other_distance[destination]
+                meeting_node = destination
+
+    if meeting_node is None:
+        return inf, []
+    # The backward parents point towards target, so they unwind straight into the second half of the path
+    path = _unwind_path(forward[2], meeting_node)
+    node = backward[2][meeting_node]
+    while node is not None:
+        path.append(node)
+        node = backward[2][node]
+    return best, path
+
+
+def floyd_warshall(adjacency_matrix: List[List[float]], in_place: bool = False) -> List[List[float]]:
+    """ Computes the all pairs shortest distances with the Floyd-Warshall algorithm in pure python
+
+    Time Complexity: O(V^3). Use ''floyd_warshall_vectorized'' for anything beyond a few hundred nodes
+
+    :param adjacency_matrix: V x V matrix of edge weights, inf where there is no edge
+    :param in_place: Overwrite adjacency_matrix with the distances, otherwise work on a copy
+    :return: Returns the matrix of shortest distances
+    """
+    if not in_place:
+        adjacency_matrix = [list(row) for row in adjacency_matrix]
     number_of_nodes = len(adjacency_matrix)
     for k in range(number_of_nodes):
+        row_k = adjacency_matrix[k]
         for i in range(number_of_nodes):
+            row_i = adjacency_matrix[i]
+            distance_ik = row_i[k]
+            if distance_ik == inf:
+                continue
             for j in range(number_of_nodes):
-                if adjacency_matrix[i][k] != inf and adjacency_matrix[k][j] != inf and adjacency_matrix[i][k] + \
-                        adjacency_matrix[k][j] < adjacency_matrix[i][j]:
-                    adjacency_matrix[i][j] = adjacency_matrix[i][k] + adjacency_matrix[k][j]
+                if distance_ik + row_k[j] < row_i[j]:
+                    row_i[j] = distance_ik + row_k[j]
     return adjacency_matrix
+
+
+def _init_floyd_warshall(adjacency_matrix: Any, in_place: bool) -> Tuple['np.ndarray', 'np.ndarray']:
+    """ Builds the distance and predecessor matrices used by the vectorized Floyd-Warshall variants
+
+    predecessors[i, j] is the node before j in the shortest path from i to j, or -1 if there isn't one
+
+    :param adjacency_matrix: V x V matrix or array of edge weights, inf where there is no edge
+    :param in_place: Reuse adjacency_matrix as the distance matrix when it already is a writeable float64 array
+    :return: Returns the (distances, predecessors) pair
+    """
+    if np is None:
+        raise ImportError("The vectorized Floyd-Warshall algorithms require numpy")
+    if in_place and isinstance(adjacency_matrix, np.ndarray) and adjacency_matrix.dtype == np.float64 \
+            and adjacency_matrix.flags.writeable:
+        distances = adjacency_matrix
+    else:
+        distances = np.array(adjacency_matrix, dtype=np.float64)
+    number_of_nodes = len(distances)
+    if distances.shape != (number_of_nodes, number_of_nodes):
+        raise ValueError("The adjacency matrix must be square")
+
+    predecessors = np.repeat(np.arange(number_of_nodes)[:, None], number_of_nodes, axis=1)
+    predecessors[np.isinf(distances)] = -1
+    np.fill_diagonal(predecessors, -1)
+    return distances, predecessors
+
+
+def _relax_through(distances: 'np.ndarray', predecessors: 'np.ndarray', k: int, rows: slice, columns: slice) -> None:
+    """ Min-plus update of the distances[rows, columns] block through node k """
+    candidate = distances[rows, k, None] + distances[None, k, columns]
+    block = distances[rows, columns]
+    improved = candidate < block
+    # Most late iterations improve nothing, so skip the writes when possible
+    if improved.any():
+        np.minimum(block, candidate, out=block)
+        np.copyto(predecessors[rows, columns], predecessors[None, k, columns], where=improved)
+
+
+def floyd_warshall_vectorized(adjacency_matrix: Any,
+                              in_place: bool = False) -> Tuple['np.ndarray', 'np.ndarray']:
+    """ Computes the all pairs shortest distances with one broadcasted min-plus update per intermediate node k
+
+    Time Complexity: O(V^3), but the two inner loops run inside numpy
+
+    :param adjacency_matrix: V x V matrix or array of edge weights, inf where there is no edge
+    :param in_place: Overwrite adjacency_matrix with the distances when it is a float64 array
+    :return: Returns the (distances, predecessors) arrays, see ''reconstruct_path''
+    """
+    distances, predecessors = _init_floyd_warshall(adjacency_matrix, in_place)
+    every_node = slice(None)
+    for k in range(len(distances)):
+        _relax_through(distances, predecessors, k, every_node, every_node)
+    return distances, predecessors
+
+
+def blocked_floyd_warshall(adjacency_matrix: Any, block_size: int = 256,
+                           in_place: bool = False) -> Tuple['np.ndarray', 'np.ndarray']:
+    """ Computes the all pairs shortest distances with the cache blocked Floyd-Warshall algorithm
+
+    For every block K of intermediate nodes:
+    1 - The rows of K are relaxed through K, this only reads rows of K
+    2 - The columns of K are relaxed through K, this reads the now final rows of K
+    3 - Every other block_size x block_size tile is relaxed through K, reading the final rows and columns of K
+
+    Each update in step 3 touches a single tile, so it stays in cache while every k of K is applied to it.
+    Distances are identical to ''floyd_warshall_vectorized'', predecessors may differ between equally short paths.
+
+    :param adjacency_matrix: V x V matrix or array of edge weights, inf where there is no edge
+    :param block_size: Side of the square tiles
+    :param in_place: Overwrite adjacency_matrix with the distances when it is a float64 array
+    :return: Returns the (distances, predecessors) arrays, see ''reconstruct_path''
+    """
+    distances, predecessors = _init_floyd_warshall(adjacency_matrix, in_place)
+    number_of_nodes = len(distances)
+    blocks = [slice(start, min(start + block_size, number_of_nodes))
+              for start in range(0, number_of_nodes, block_size)]
+    every_node = slice(None)
+
+    for block in blocks:
+        intermediate_nodes = range(block.start, block.stop)
+        for k in intermediate_nodes:
+            _relax_through(distances, predecessors, k, block, every_node)
+        for k in intermediate_nodes:
+            _relax_through(distances, predecessors, k, every_node, block)
+        for rows in blocks:
+            if rows == block:
+                continue
+            for columns in blocks:
+                if columns == block:
+                    continue
+                for k in intermediate_nodes:
+                    _relax_through(distances, predecessors, k, rows, columns)
+    return distances, predecessors
+
+
+def reconstruct_path(predecessors: Any, source: int, target: int) -> List[int]:
+    """ Rebuilds the shortest path between two nodes from a Floyd-Warshall predecessor matrix
+
+    :param predecessors: Predecessor matrix returned by the vectorized Floyd-Warshall variants
+    :param source: First node of the path
+    :param target: Last node of the path
+    :return: Returns the list of nodes from source to target, empty if target can't be reached
+    """
+    if source == target:
+        return [source]
+    path = [target]
+    while target != source:
+        target = int(predecessors[source][target])
+        if target == -1:
+            return []
+        path.append(target)
+    path.reverse()
+    return path
+
+
+def prim_mst_dense(adjacency_matrix: Any) -> List[Edge]:
+    """ Computes the MST by Prim's algorithm straight on a dense adjacency matrix
+
+    Keys, parents and the in-tree mask are numpy arrays, so every round is one argmin to pick the next vertex
+    and one vectorized comparison against its matrix row to update all keys. Takes the matrix directly, so
+    complete graphs too big for per-edge objects can be loaded with numpy alone. The matrix must be symmetric.
+    Time Complexity: O(V^2), all in numpy
+
+    :param adjacency_matrix: V x V matrix or array of edge weights, inf where there is no edge
+    :return: Returns the V - 1 edges of the MST as (parent, vertex, weight), fewer if the graph is disconnected
+    """
+    if np is None:
+        raise ImportError("The dense Prim algorithm requires numpy")
+    matrix = np.asarray(adjacency_matrix, dtype=np.float64)
+    number_of_nodes = len(matrix)
+    if matrix.shape != (number_of_nodes, number_of_nodes):
+        raise ValueError("The adjacency matrix must be square")
+    keys = np.full(number_of_nodes, inf)
+    parents = np.full(number_of_nodes, -1, dtype=np.int64)
+    in_tree = np.zeros(number_of_nodes, dtype=bool)
+    result = list()  # type: List[Edge]
+    if number_of_nodes == 0:
+        return result
+    keys[0] = 0.0
+
+    for _ in range(number_of_nodes):
+        min_index = int(np.argmin(keys))
+        if keys[min_index] == inf:
+            break  # The remaining vertices can't be reached
+        in_tree[min_index] = True
+        keys[min_index] = inf  # Tree vertices are never picked again
+        parent = int(parents[min_index])
+        if parent != -1:
+            result.append(Edge(parent, min_index, matrix[parent, min_index].item()))
+
+        row = matrix[min_index]
+        improved = row < keys
+        improved &= ~in_tree
+        keys[improved] = row[improved]
+        parents[improved] = min_index
+
+    return result
@@ -1,22 +1,225 @@
+import heapq
 import operator
+from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
 from collections import defaultdict, deque, namedtuple
 from math import inf
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Iterable, Tuple, Optional, Sequence, Any, Callable, Hashable, Iterator, Type
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, used for the numpy matrix format and edge sorting
+    np = None
+
+from data_structures.disjoint_sets.disjoint_set import DisjointSet
 from data_structures.queues.priority_queue import MinHeap
 
 # TODO: Build a builder for the Graph class
 # TODO: Subclass the graph class to handle max nodes
 # TODO: Handle construction of graph better better
 # TODO: Subclass different types of graphs
-# TODO: Krustal's MST beginning is a mess
-# TODO: Read Union-Find by rank and understand difference
 # TODO: These MST algos really belong in their own file, not inside the graph class
 
 Edge = namedtuple("Edge", ["source", "destination", "weight"])
+_SOURCE = operator.itemgetter(0)
+_DESTINATION = operator.itemgetter(1)
+Visitor = Callable[[Hashable, int, Optional[Hashable]], Optional[bool]]
+
+SORT_CHUNK_SIZE = 1 << 16  # Sorted indexes are turned into python ints one chunk at a time
+
+
+def _as_edge(edge: Tuple) -> Edge:
+    """ Converts a (u, v) or (u, v, weight) tuple into an Edge, weight defaults to 1
+
+    Raise ValueError for tuples of any other length
+    """
+    if len(edge) == 3:
+        return Edge._make(edge)
+    if len(edge) == 2:
+        return Edge(edge[0], edge[1], 1)
+    raise ValueError("Edges must be (u, v) or (u, v, weight) tuples, got {0}".format(edge))
+
+
+def iter_indexes_by_weight(weights: Sequence[float], lazy: bool = False) -> Iterator[int]:
+    """ Yields the indexes of weights in increasing weight order, equal weights keep their index order
+
+    The eager mode argsorts the whole weight array, with numpy when it is available, so no Edge is ever compared.
+    The lazy mode heapifies (weight, index) pairs in O(E) and pays O(log(E)) only for the indexes consumed, which
+    wins when the caller stops early.
+
+    :param weights: Weight of every edge, ideally a typed array
+    :param lazy: Heapify instead of sorting
+    """
+    if lazy:
+        heap = list(zip(weights, range(len(weights))))
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap)[1]
+    elif np is not None:
+        order = np.argsort(np.asarray(weights, dtype=np.float64), kind='stable')
+        for start in range(0, len(order), SORT_CHUNK_SIZE):
+            yield from order[start:start + SORT_CHUNK_SIZE].tolist()
+    else:
+        yield from sorted(range(len(weights)), key=weights.__getitem__)
+
+
+def kruskal_edge_indexes(number_of_nodes: int, sources: Sequence[int], destinations: Sequence[int],
+                         weights: Sequence[float], lazy: bool = False) -> List[int]:
+    """ Kruskal's method over parallel edge arrays
+
+    Stops as soon as the tree has number_of_nodes - 1 edges
+
+    :param number_of_nodes: Nodes are 0..number_of_nodes-1
+    :param sources: Source node of every edge
+    :param destinations: Destination node of every edge
+    :param weights: Weight of every edge
+    :param lazy: Heapify the edges and pop them on demand instead of sorting them all up front
+    :return: Returns the indexes of the edges in the minimum spanning tree, in the order they were picked
+    """
+    subsets = DisjointSet(number_of_nodes)
+    target_number_edges = number_of_nodes - 1  # type: int
+    result = list()  # type: List[int]
+    if target_number_edges <= 0:
+        return result
+
+    union = subsets.union
+    for index in iter_indexes_by_weight(weights, lazy):
+        if union(sources[index], destinations[index]):
+            result.append(index)
+            if len(result) == target_number_edges:
+                break
+    return result
+
+
+class BaseGraph(ABC):
+    """ Common interface shared by every graph representation
+
+    Subclasses must implement ``__len__``, ``edges(u)`` and ``reverse()``, which the traversals are written against.
+    An incomplete subclass fails when it is instantiated.
+
+    Interface:
+        edges(u) -> iterable of (source, destination, weight) triples leaving node u
+        neighbours(u) -> iterable of the destinations of the edges leaving node u
+        reverse() -> graph with every edge reversed
+        iter_bfs(source_node) / iter_dfs(source_node) -> lazy traversals
+        bfs(source_node) -> breadth first order
+        recursive_dfs(source_node) -> depth first order
+
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def edges(self, u: int) -> Iterable[Tuple[int, int, float]]:
+        """ Returns the edges leaving node u as (source, destination, weight) triples
+
+        :param u: origin node
+        """
+        pass
+
+    def neighbours(self, u: int) -> Iterable[int]:
+        """ Returns the destinations of the edges leaving node u, the traversals only need these
+
+        Subclasses should override it with something cheaper than unpacking ``edges(u)``
+
+        :param u: origin node
+        """
+        return [destination for _, destination, _ in self.edges(u)]
+
+    @abstractmethod
+    def reverse(self) -> 'BaseGraph':
+        """ Returns a new graph of the same type with every edge reversed """
+        pass
+
+    def iter_bfs(self, source_node: Hashable, max_depth: int = None, visitor: Visitor = None,
+                 with_details: bool = False) -> Iterator[Any]:
+        """ Lazily yields the nodes reachable from source_node in breadth first order
+
+        Stopping the iteration stops the traversal, so nothing past the last consumed node is explored.
+        Nodes can be any hashable, they don't have to be the ints 0..V-1.
+
+        :param source_node: Source node for BFS
+        :param max_depth: Nodes further than max_depth edges from source_node aren't visited
+        :param visitor: Called as visitor(node, depth, parent) for every node, returning False skips its edges
+        :param with_details: Yield (node, depth, parent) tuples instead of nodes, parent is None for source_node
+        """
+        visited = {source_node}  # type: Set[Hashable]
+        queue = deque([(source_node, 0, None)])  # type: deque
+
+        while queue:
+            node, depth, parent = queue.popleft()
+            yield (node, depth, parent) if with_details else node
+            if visitor is not None and visitor(node, depth, parent) is False:
+                continue
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for adjacent_node in self.neighbours(node):
+                if adjacent_node not in visited:
+                    visited.add(adjacent_node)
+                    queue.append((adjacent_node, depth + 1, node))
+
+    def iter_dfs(self, source_node: Hashable, max_depth: int = None, visitor: Visitor = None,
+                 with_details: bool = False) -> Iterator[Any]:
+        """ Lazily yields the nodes reachable from source_node in depth first order
+
+        Nodes come out in the same order as a recursive DFS, but an explicit stack of edge iterators replaces the
+        recursion, so deep graphs can't hit the recursion limit.
+
+        .. seealso:: ''BaseGraph.iter_bfs''
+
+        :param source_node: Source node for DFS
+        :param max_depth: Nodes further than max_depth edges from source_node aren't visited
+        :param visitor: Called as visitor(node, depth, parent) for every node, returning False skips its edges
+        :param with_details: Yield (node, depth, parent) tuples instead of nodes, parent is None for source_node
+        """
+        visited = {source_node}  # type: Set[Hashable]
+        stack = list()  # type: List[Tuple[Hashable, int, Iterator]]
+
+        node, depth, parent = source_node, 0, None
+        while True:
+            yield (node, depth, parent) if with_details else node
+            expand = visitor is None or visitor(node, depth, parent) is not False
+            if expand and (max_depth is None or depth < max_depth):
+                stack.append((node, depth, iter(self.neighbours(node))))
+
+            # Find the next unvisited node, backtracking when a node runs out of edges
+            while stack:
+                parent, parent_depth, neighbours = stack[-1]
+                for adjacent_node in neighbours:
+                    if adjacent_node not in visited:
+                        break
+                else:
+                    stack.pop()
+                    continue
+                visited.add(adjacent_node)
+                node, depth = adjacent_node, parent_depth + 1
+                break
+            else:
+                return
+
+    def bfs(self, source_node: int) -> List[int]:
+        """
+
+        :param source_node: Source node for BFS
+        :return order: Final order in which nodes were visited
+        """
+        return list(self.iter_bfs(source_node))
+
+    def recursive_dfs(self, source_node: int) -> List[int]:
+        """ Performs Depth First Search, in the order of a recursive DFS
+
+        .. seealso:: ''BaseGraph.iter_dfs''
+
+        :param source_node: Source node for DFS
+        :return order: Final order in which nodes were visited
+        """
+        return list(self.iter_dfs(source_node))
 
 
-class Graph:
+class Graph(BaseGraph):
     """ This class represents a directed graph using adjacency
     list representation
 
@@ -24,9 +227,17 @@ class Graph:
         Graph(number_of_nodes) -> constructor
         build() -> build from list of lists
         add_edge(u,v,weight) -> add an edge between nodes u an v with weight
+        add_edges(edges) -> bulk add (u, v) or (u, v, weight) tuples
+        add_edges_from_arrays(sources, destinations, weights) -> bulk add from parallel arrays
+        freeze() -> immutable CSRGraph copy for fast traversals
+        to_matrix(format) -> cached 'list', 'numpy' or 'sparse' adjacency matrix
 
     """
 
+    LIST_MATRIX = 'list'
+    NUMPY_MATRIX = 'numpy'
+    SPARSE_MATRIX = 'sparse'
+
     def __init__(self, vertices: int = None) -> None:
         """ Constructor
 
@@ -37,7 +248,11 @@ class Graph:
         self.v = vertices
         # Default dictionary to store graph
         self.graph = defaultdict(list)  # type: Dict[int, List]
-        self._matrix = None
+        # Set of every edge in the graph, so duplicates are found in O(1). None while it isn't being tracked
+        self._edge_index = set()  # type: Optional[Set[Edge]]
+        # Bumped on every mutation, cached matrices are only valid for the version they were built for
+        self._version = 0  # type: int
+        self._matrices = dict()  # type: Dict[str, Tuple[int, Any]]
 
     def __len__(self):
 
@@ -53,107 +268,116 @@ class Graph:
         :param u: origin node
         :param v: destination node
         """
-        # If the graph was constructed with a max number of edges we must check for this
-        if self.v is not None and self.v < len(self.graph):
-            raise Exception("Graph's max size reached")
+        # If the graph was constructed with a max number of nodes we must check for this
+        self._check_max_size(max(u, v))
 
-        # Checks if edge already exists - This makes adding slow
+        # Checks if edge already exists
         new_edge = Edge(source=u, destination=v, weight=weight)
-        if new_edge not in self.graph[u]:
+        edge_index = self._get_edge_index()
+        if new_edge not in edge_index:
+            edge_index.add(new_edge)
             self.graph[u].append(new_edge)
+            self._version += 1
 
-    def bfs(self, source_node: int) -> List[int]:
-        """
-        
-        :param source_node: Source node for BFS
-        :return order: Final order in which nodes were visited
-        """
+    def add_edges(self, edges: Iterable[Tuple], deduplicate: bool = True) -> None:
+        """ Adds every edge of an iterable of (u, v) or (u, v, weight) tuples
 
-        # Store visited order in a list
-        order = list()  # type: List[int]
+        With ``deduplicate=False`` the duplicate check and the edge index are skipped altogether, which is the fast
+        path for loading edge lists that are known to be unique. The index is then rebuilt lazily, in a single O(E)
+        pass, the next time a deduplicated add needs it.
 
-        # Mark all the vertices as not visited
-        visited = [False] * (len(self))  # type: List[bool]
+        Raise ValueError if an edge isn't a (u, v) or (u, v, weight) tuple
+        Raise Exception if the graph has a max size and an edge has a node id outside of it, no edge is added then
 
-        # Create queue for BFS
-        queue = deque()  # type: deque[int]
+        :param edges: Iterable of (u, v) or (u, v, weight) tuples, weight defaults to 1
+        :param deduplicate: Skip edges that are already in the graph
+        """
+        edges = list(edges)
+        try:
+            new_edges = list(map(Edge._make, edges))
+        except TypeError:  # Some edges are (u, v) pairs without a weight
+            new_edges = [_as_edge(edge) for edge in edges]
+        self._add_edge_objects(new_edges, deduplicate)
+
+    def add_edges_from_arrays(self, sources: Sequence[int], destinations: Sequence[int],
+                              weights: Sequence[float] = None, deduplicate: bool = True) -> None:
+        """ Adds the edges described by parallel arrays of sources, destinations and weights
+
+        .. seealso:: ''Graph.add_edges''
+
+        :param sources: Source node of every edge
+        :param destinations: Destination node of every edge
+        :param weights: Weight of every edge, defaults to 1
+        :param deduplicate: Skip edges that are already in the graph
+        """
+        weights = repeat(1) if weights is None else weights
+        self._add_edge_objects(list(map(Edge._make, zip(sources, destinations, weights))), deduplicate)
 
-        # Mark the source node as visited and enqueue it
-        queue.append(source_node)
-        visited[source_node] = True
+    def _check_max_size(self, highest_node: int) -> None:
+        """ The nodes of a graph constructed with a size v are 0..v-1, shared by the single and bulk adds
 
-        while queue:
-            next_node = queue.popleft()
-            order.append(next_node)
-            for edge in self.graph[next_node]:
-                # Check the edge object
-                assert isinstance(edge, Edge)
-                assert isinstance(edge.destination, int)
-                adjacent_node = edge.destination
-                if visited[adjacent_node] is False:
-                    queue.append(adjacent_node)
-                    visited[adjacent_node] = True
-        return order
-
-    def recursive_dfs_util(self, next_node: int, visited: List[int], order: List[int]) -> List[int]:
-        """ Utility function for recursive Depth First
-
-        :param order: order in which nodes are visited
-        :param next_node: next_node to be considered
-        :param visited: List of booleans signifying visited nodes
+        Raise Exception if highest_node is outside of the graph
         """
+        if self.v is not None and highest_node >= self.v:
+            raise Exception("Graph's max size reached")
 
-        # Mark the current node as visited and print it
-        visited[next_node] = True
-        order.append(next_node)
-
-        for edge in self.graph[next_node]:
-            # Check the edge object
-            assert isinstance(edge, Edge)
-            assert isinstance(edge.destination, int)
-            adjacent_node = edge.destination
-            if visited[adjacent_node] is False:
-                order = self.recursive_dfs_util(adjacent_node, visited, order)
+    def _add_edge_objects(self, new_edges: List[Edge], deduplicate: bool) -> None:
+        """ Bulk add shared by ''add_edges'' and ''add_edges_from_arrays'', the max size is checked once """
+        if self.v is not None and new_edges:
+            self._check_max_size(max(max(map(_SOURCE, new_edges)), max(map(_DESTINATION, new_edges))))
+
+        graph = self.graph
+        self._version += 1
+        if deduplicate:
+            edge_index = self._get_edge_index()
+            for new_edge in new_edges:
+                if new_edge not in edge_index:
+                    edge_index.add(new_edge)
+                    graph[new_edge[0]].append(new_edge)
+        else:
+            self._edge_index = None
+            for new_edge in new_edges:
+                graph[new_edge[0]].append(new_edge)
 
-        return order
+    def _get_edge_index(self) -> Set[Edge]:
+        """ Returns the edge index, rebuilding it if a bulk add skipped it """
+        if self._edge_index is None:
+            self._edge_index = {edge for node_edges in self.graph.values() for edge in node_edges}
+        return self._edge_index
 
-    def recursive_dfs(self, source_node: int) -> List[int]:
-        """ Performs a recursive version of Depth First Search
+    def edges(self, u: int) -> List[Edge]:
+        """ Returns the adjacency list of node u without creating an entry for it
 
-        :param source_node: Source node for DFS
-        :return order: Final order in which nodes were visited
+        :param u: origin node
         """
+        return self.graph.get(u, [])
 
-        # Store visited order in a list
-        order = list()  # type: List[int]
+    def neighbours(self, u: int) -> List[int]:
+        """ Returns the destinations of the adjacency list of node u
 
-        # Mark all the vertices as not visited
-        visited = [False] * (len(self))  # type: List[bool]
-        return self.recursive_dfs_util(source_node, visited, order)
+        :param u: origin node
+        """
+        return list(map(_DESTINATION, self.graph.get(u, ())))
 
-    #
-    def find_parent(self, parents_array: List[int], node_index: int) -> int:
-        """ A utility function to find the subset of an element node_index
+    def reverse(self) -> 'Graph':
+        """ Returns a new graph with every edge reversed
 
-        :param parents_array:
-        :param node_index:
-        :return: Returns the final index of the node's parent
+        :return: Returns the new Graph object
         """
-        if parents_array[node_index] == -1:
-            return node_index
-        if parents_array[node_index] != -1:
-            return self.find_parent(parents_array, parents_array[node_index])
+        reversed_graph = self.__class__(self.v)
+        reversed_graph.add_edges(((v, u, weight) for node_edges in self.graph.values()
+                                  for u, v, weight in node_edges), deduplicate=False)
+        return reversed_graph
+
+    def freeze(self) -> 'CSRGraph':
+        """ Converts the graph into an immutable compressed sparse row representation
 
-    def union(self, parents_array: List[int], x: int, y: int) -> None:
-        """ A utility function to do union of two subsets
+        .. seealso:: ''CSRGraph.from_graph''
 
-        :param parents_array: marks the parent of each node
-        :param x: First node to join
-        :param y: Second node to join
+        :return: Returns a new CSRGraph with the same nodes and edges
         """
-        x_set = self.find_parent(parents_array, x)
-        y_set = self.find_parent(parents_array, y)
-        parents_array[x_set] = y_set
+        from data_structures.graphs.csr import CSRGraph
+        return CSRGraph.from_graph(self)
 
     def contains_cycle(self) -> bool:
         """ The main function to check whether a given graph contains cycle or not
@@ -162,65 +386,41 @@ class Graph:
 
         :return: Returns True if a cycle is found, False if it isn't
         """
-        # Allocate memory for creating V subsets and
-        # Initialize all subsets as single element sets
-        init_value = -1  # type: int
-        parents_array = [init_value] * (len(self))  # type: List[int]
+        # Every node starts in its own subset
+        subsets = DisjointSet(len(self))
 
         for i in self.graph:
-            for edge in self.graph[i]:
-                assert isinstance(edge, Edge)
-                assert isinstance(edge.destination, int)
-                j = edge.destination
+            for _, j, _ in self.graph[i]:
                 if i == j:
                     # Self loop found
                     raise Exception("Graph has self loop")
-                parent_of_i = self.find_parent(parents_array, i)
-                parent_of_j = self.find_parent(parents_array, j)
-                if parent_of_i == parent_of_j:
+                if not subsets.union(i, j):
                     # Cycle found
                     return True
-                self.union(parents_array, parent_of_i, parent_of_j)
         return False
 
-    def find(self, parent, i):
-        if parent[i] == i:
-            return i
-        return self.find(parent, parent[i])
-
-    def kruskal_mst(self) -> List[Edge]:
+    def kruskal_mst(self, lazy: bool = False) -> List[Edge]:
         """ Computes the minimum spanning tree with Kruskal's method
 
+        .. seealso:: ''kruskal_edge_indexes''
+
+        :param lazy: Heapify the edges and pop them on demand instead of sorting them all up front
         :return: returns a list with the minimum spanning tree
         """
-        init_value = -1
-        edges_so_far = 0  # type:int
-        parents_array = [init_value] * (len(self))  # type: List[int]
-        target_number_edges = len(self) - 1  # type: int
-        result = list()  # type: List[Edge]
-
-        sorted_edges = self.sort_edges_by_weight()  # type: List[Edge]
-        for edge in sorted_edges:
-            source, destination, _ = edge
-            parent_source = self.find_parent(parents_array, source)
-            parent_destination = self.find_parent(parents_array, destination)
-            if parent_source != parent_destination:
-                result.append(edge)
-                edges_so_far += 1
-                if edges_so_far == target_number_edges:
-                    break
-                self.union(parents_array=parents_array, x=parent_source, y=parent_destination)
-
-        return result
+        edges_list = [edge for node_edges in self.graph.values() for edge in node_edges]  # type: List[Edge]
+        sources = array('q', (edge.source for edge in edges_list))
+        destinations = array('q', (edge.destination for edge in edges_list))
+        weights = array('d', (edge.weight for edge in edges_list))
+        return [edges_list[index] for index in kruskal_edge_indexes(len(self), sources, destinations, weights, lazy)]
 
     def sort_edges_by_weight(self) -> List[Edge]:
         """
-        
+
         :return: List  of edges sorted by weight
         """
-        edges_list = [edge for node in self.graph for edge in self.graph[node]]
-        edges_list.sort(key=lambda x: x.weight)
-        return edges_list
+        edges_list = [edge for node_edges in self.graph.values() for edge in node_edges]
+        weights = array('d', (edge.weight for edge in edges_list))
+        return [edges_list[index] for index in iter_indexes_by_weight(weights)]
 
     def prim_mst(self):
         """ Computes the MST by Prim's algorithm
@@ -242,7 +442,8 @@ class Graph:
         keys = [inf] * len(self)  # type: List[float]
         keys[0] = 0.0
 
-        result = set()  # type: Set[Edge]
+        # Cheapest edge connecting each vertex to the tree so far, only the final one belongs to the MST
+        parent_edges = dict()  # type: Dict[int, Edge]
 
         while mst_set != vertices:
             min_index = self.get_vertice_with_min_weight(keys, mst_set)  # O(2N) = O(N)
@@ -250,19 +451,32 @@ class Graph:
 
             for edge in self.graph[min_index]:  # A node has at most V-1 Edges, so O(V)
                 source, destination, weight = edge
-                if weight < keys[destination]:
+                if destination not in mst_set and weight < keys[destination]:
                     keys[destination] = float(weight)  # float to make it  consistent
-                    result.add(edge)
+                    parent_edges[destination] = edge
 
-        return result
+        return set(parent_edges.values())
+
+    def prim_mst_dense(self) -> List[Edge]:
+        """ Computes the MST by Prim's algorithm on the numpy adjacency matrix
 
-    def prim_mst_with_heap(self):
+        The graph must be undirected, i.e. every edge is added in both directions.
+
+        .. seealso:: ''algorithms.prim_mst_dense'', which takes the matrix directly
+
+        :return: Returns the V - 1 edges of the MST as (parent, vertex, weight), fewer if the graph is disconnected
+        """
+        from data_structures.graphs.algorithms import prim_mst_dense
+        return prim_mst_dense(self.to_matrix(self.NUMPY_MATRIX))
+
+    def prim_mst_with_heap(self, queue_class: Type = MinHeap) -> Set[Edge]:
         """ Computes the MST by Prim's algorithm
 
         This method uses the adjacency lists but works as if the graph was represented through adjacency matrix
+        Vertices are only queued once an edge reaches them, and pushing a queued vertex again updates its key.
         Time Complexity: O((V + E)log(V))
 
-
+        :param queue_class: Priority queue to use, e.g. BucketQueue when weights are small non negative integers
         :return:
         """
 
@@ -272,36 +486,98 @@ class Graph:
         # Initial value is inf for all but the first one
         keys = [inf] * len(self)  # type: List[float]
         keys[0] = 0.0
-        priority_queue = MinHeap.build([(i, priority) for i, priority in enumerate(keys)])
+        priority_queue = queue_class()
+        priority_queue.push(item=0, priority=0)
 
-        result = set()  # type: Set[Edge]
+        # Cheapest edge connecting each vertex to the tree so far, only the final one belongs to the MST
+        parent_edges = dict()  # type: Dict[int, Edge]
 
         while priority_queue:  # Priority queue has O(V) elements
             min_index = priority_queue.pop()  # O(log(V))
             mst_set.add(min_index)
 
-            for edge in self.graph[min_index]:  # A graph has at most 2E Edges in adjacency list, so O(E)
+            for edge in self.edges(min_index):  # A graph has at most 2E Edges in adjacency list, so O(E)
                 source, destination, weight = edge
-                if priority_queue.contains_item(destination) and weight < keys[destination]:  # O(1)
+                if destination not in mst_set and weight < keys[destination]:  # O(1)
                     keys[destination] = weight
-                    priority_queue.push(item=destination, priority=weight)  # O(log(V))
-                    result.add(edge)
+                    priority_queue.push(item=destination, priority=weight)  # Decrease-key, O(log(V))
+                    parent_edges[destination] = edge
 
-        return result
+        return set(parent_edges.values())
 
     @property
-    def adjacency_matrix(self):
-        if not self._matrix:
-            self._matrix = [[inf for item in range(len(self))] for item in range(len(self))]
-            for i in range(len(self)):
-                self._matrix[i][i] = 0.0
-            for i in range(len(self)):
-                for edge in self.graph[i]:
-                    source, destination, weight = edge
-                    self._matrix[source][destination] = weight
-        return self._matrix
+    def adjacency_matrix(self) -> List[List[float]]:
+        """ Dense list of lists adjacency matrix, inf where there is no edge and 0 in the diagonal
 
+        .. seealso:: ''Graph.to_matrix''
+        """
+        return self.to_matrix(self.LIST_MATRIX)
+
+    def to_matrix(self, matrix_format: str = LIST_MATRIX) -> Any:
+        """ Returns a matrix view of the graph in the requested format
+
+        Formats:
+            'list' -> dense V x V list of lists, inf where there is no edge and 0 in the diagonal
+            'numpy' -> the same dense matrix as a float64 numpy array
+            'sparse' -> dict of dicts ``{u: {v: weight}}`` holding only the edges, O(V + E) memory
 
+        The matrix is built from the edges once per graph version and cached privately. Callers get a copy of the
+        list and sparse formats, and a read-only view of the numpy one, so changing the result never changes the
+        cache; copy the numpy array to modify it.
+
+        :param matrix_format: One of 'list', 'numpy' or 'sparse'
+        :return: Returns the matrix
+        """
+        matrix = self._cached_matrix(matrix_format)
+        if matrix_format == self.LIST_MATRIX:
+            return [list(row) for row in matrix]
+        if matrix_format == self.SPARSE_MATRIX:
+            return {u: dict(row) for u, row in matrix.items()}
+        view = matrix.view()
+        view.flags.writeable = False
+        return view
+
+    def _cached_matrix(self, matrix_format: str) -> Any:
+        """ Returns the cached matrix of the current version, building it if needed, it must never be mutated """
+        builders = {
+            self.LIST_MATRIX: self._build_list_matrix,
+            self.NUMPY_MATRIX: self._build_numpy_matrix,
+            self.SPARSE_MATRIX: self._build_sparse_matrix,
+        }
+        if matrix_format not in builders:
+            raise ValueError("Unknown matrix format {0}".format(matrix_format))
+
+        version, matrix = self._matrices.get(matrix_format, (None, None))
+        if version != self._version:
+            matrix = builders[matrix_format]()
+            self._matrices[matrix_format] = (self._version, matrix)
+        return matrix
+
+    def _build_list_matrix(self) -> List[List[float]]:
+        number_of_nodes = len(self)
+        matrix = [[inf] * number_of_nodes for _ in range(number_of_nodes)]
+        for i in range(number_of_nodes):
+            matrix[i][i] = 0.0
+            for source, destination, weight in self.edges(i):
+                matrix[source][destination] = weight
+        return matrix
+
+    def _build_numpy_matrix(self) -> 'np.ndarray':
+        if np is None:
+            raise ImportError("The numpy matrix format requires numpy")
+        number_of_nodes = len(self)
+        matrix = np.full((number_of_nodes, number_of_nodes), inf)
+        np.fill_diagonal(matrix, 0.0)
+        for i in range(number_of_nodes):
+            for source, destination, weight in self.edges(i):
+                matrix[source, destination] = weight
+        return matrix
+
+    def _build_sparse_matrix(self) -> Dict[int, Dict[int, float]]:
+        return {
+            node: {destination: weight for _, destination, weight in node_edges}
+            for node, node_edges in self.graph.items() if node_edges
+        }
 
     @staticmethod
     def get_vertice_with_min_weight(keys: List[float], mst_set: Set[int]) -> int:
@@ -317,8 +593,13 @@ class Graph:
     def __str__(self) -> str:
         """ Prints the graph by printing nodes and and their respective adjacent nodes
 
+        One line per node, formatted as ``u -> v(weight), ...``
         """
-        return str(self.adjacency_matrix)
+        return "\n".join(
+            "{0} -> {1}".format(node, ", ".join("{0}({1})".format(destination, weight)
+                                                for _, destination, weight in node_edges))
+            for node, node_edges in sorted(self.graph.items())
+        )
 
     @classmethod
     def build(cls, adjacency_matrix):
@@ -0,0 +1,160 @@
+from array import array
+from itertools import repeat
+from typing import Iterable, Tuple, Sequence, List
+
+from data_structures.graphs.base import BaseGraph, Graph, Edge, kruskal_edge_indexes
+
+OFFSET_TYPECODE = 'q'  # Offsets index into the edge arrays, so they must hold up to E
+NODE_TYPECODE = 'i'  # Node ids are dense and fit 32 bits
+WEIGHT_TYPECODE = 'd'
+
+
+class CSRGraph(BaseGraph):
+    """ This class represents a frozen directed graph using compressed sparse row storage
+
+    The edges of node u are the slice ``offsets[u]:offsets[u + 1]`` of the ``destinations`` and ``weights`` arrays.
+    Every array is a typed contiguous ``array.array``, so an edge costs 12 bytes instead of a namedtuple plus a
+    list slot. Nodes are the dense ints 0..V-1 and the graph can't be modified once built.
+
+    Interface:
+        CSRGraph(offsets, destinations, weights) -> constructor from the raw arrays
+        from_graph(graph) -> build from an adjacency list Graph
+        from_edges(number_of_nodes, sources, destinations, weights) -> build from parallel edge arrays
+        edges(u) -> (source, destination, weight) triples leaving u
+        neighbours(u) -> destinations of the edges leaving u
+        reverse() -> CSRGraph with every edge reversed
+        kruskal_mst() -> minimum spanning tree edges
+
+    """
+
+    def __init__(self, offsets: array, destinations: array, weights: array) -> None:
+        """ Constructor
+
+        :param offsets: V + 1 offsets, the edges of node u live in [offsets[u], offsets[u + 1])
+        :param destinations: E destination nodes
+        :param weights: E edge weights
+        """
+        if len(offsets) == 0 or offsets[-1] != len(destinations) or len(destinations) != len(weights):
+            raise ValueError("Inconsistent CSR arrays")
+        self.offsets = offsets
+        self.destinations = destinations
+        self.weights = weights
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def number_of_edges(self) -> int:
+        return len(self.destinations)
+
+    def degree(self, u: int) -> int:
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def neighbours(self, u: int) -> array:
+        """ Returns a copy of the destinations slice of node u, what the traversals walk
+
+        :param u: origin node
+        """
+        return self.destinations[self.offsets[u]:self.offsets[u + 1]]
+
+    def edges(self, u: int) -> Iterable[Tuple[int, int, float]]:
+        """ Returns the edges leaving node u as (source, destination, weight) triples
+
+        The slices are copied in C, so iterating them is much cheaper than chasing Edge objects
+
+        :param u: origin node
+        """
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(repeat(u, end - start), self.destinations[start:end], self.weights[start:end])
+
+    def edge_sources(self) -> array:
+        """ Expands the offsets into the source node of every edge
+
+        :return: Returns an array parallel to destinations and weights
+        """
+        sources = array(NODE_TYPECODE)
+        for node in range(len(self)):
+            sources.extend(repeat(node, self.degree(node)))
+        return sources
+
+    def reverse(self) -> 'CSRGraph':
+        """ Returns a new CSRGraph with every edge reversed
+
+        :return: Returns the new CSRGraph object
+        """
+        return self.from_edges(len(self), self.destinations, self.edge_sources(), self.weights)
+
+    def kruskal_mst(self, lazy: bool = False) -> List[Edge]:
+        """ Computes the minimum spanning tree with Kruskal's method straight on the CSR arrays
+
+        .. seealso:: ''kruskal_edge_indexes''
+
+        :param lazy: Heapify the edges and pop them on demand instead of sorting them all up front
+        :return: returns a list with the minimum spanning tree
+        """
+        sources = self.edge_sources()
+        destinations, weights = self.destinations, self.weights
+        return [Edge(sources[index], destinations[index], weights[index])
+                for index in kruskal_edge_indexes(len(self), sources, destinations, weights, lazy)]
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'CSRGraph':
+        """ Builds the CSR representation of an adjacency list Graph
+
+        Edges keep the order in which they were added, so traversals visit nodes in the same order.
+
+        :param graph: Graph with non negative int nodes
+        :return: Returns the new CSRGraph object
+        """
+        number_of_nodes = len(graph)
+        for node, node_edges in graph.graph.items():
+            number_of_nodes = max(number_of_nodes, node + 1)
+            for edge in node_edges:
+                number_of_nodes = max(number_of_nodes, edge.destination + 1)
+
+        offsets = array(OFFSET_TYPECODE, [0])
+        destinations = array(NODE_TYPECODE)
+        weights = array(WEIGHT_TYPECODE)
+        for node in range(number_of_nodes):
+            for _, destination, weight in graph.edges(node):
+                destinations.append(destination)
+                weights.append(weight)
+            offsets.append(len(destinations))
+        return cls(offsets, destinations, weights)
+
+    @classmethod
+    def from_edges(cls, number_of_nodes: int, sources: Sequence[int], destinations: Sequence[int],
+                   weights: Sequence[float] = None) -> 'CSRGraph':
+        """ Builds the CSR representation straight from parallel edge arrays with a counting sort
+
+        This never materialises Edge objects, so it is the way to load very large graphs.
+        Edges with the same source keep their input order.
+
+        :param number_of_nodes: Nodes are 0..number_of_nodes-1
+        :param sources: Source node of every edge
+        :param destinations: Destination node of every edge
+        :param weights: Weight of every edge, defaults to 1
+        :return: Returns the new CSRGraph object
+        """
+        number_of_edges = len(sources)
+        if len(destinations) != number_of_edges or (weights is not None and len(weights) != number_of_edges):
+            raise ValueError("sources, destinations and weights must have the same length")
+
+        # Count the out degree of every node and turn it into offsets
+        offsets = array(OFFSET_TYPECODE, bytes(8 * (number_of_nodes + 1)))
+        for source in sources:
+            offsets[source + 1] += 1
+        for node in range(number_of_nodes):
+            offsets[node + 1] += offsets[node]
+
+        # Scatter every edge into its slot
+        next_slot = offsets[:-1]
+        sorted_destinations = array(NODE_TYPECODE, bytes(4 * number_of_edges))
+        sorted_weights = array(WEIGHT_TYPECODE, repeat(1.0, number_of_edges))
+        for index, source in enumerate(sources):
+            slot = next_slot[source]
+            next_slot[source] = slot + 1
+            sorted_destinations[slot] = destinations[index]
+            if weights is not None:
+                sorted_weights[slot] = weights[index]
+        return cls(offsets, sorted_destinations, sorted_weights)
@@ -0,0 +1,92 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Iterable, Iterator, List, Tuple
+
+from data_structures.graphs.algorithms import dijkstra_shortest_path
+from data_structures.graphs.base import BaseGraph, Graph
+from data_structures.graphs.csr import CSRGraph
+
+# Graph attached by every worker process in ''_attach_graph''
+_worker_graph = None  # type: CSRGraph
+_worker_memory = None  # type: shared_memory.SharedMemory
+
+
+def _layout(number_of_nodes: int, number_of_edges: int) -> Tuple[slice, slice, slice]:
+    """ Byte ranges of the offsets, weights and destinations arrays inside the shared memory block
+
+    The 8 byte arrays go first so every array stays aligned to its item size
+    """
+    offsets_end = 8 * (number_of_nodes + 1)
+    weights_end = offsets_end + 8 * number_of_edges
+    destinations_end = weights_end + 4 * number_of_edges
+    return slice(0, offsets_end), slice(offsets_end, weights_end), slice(weights_end, destinations_end)
+
+
+def _share_graph(graph: CSRGraph) -> shared_memory.SharedMemory:
+    """ Copies the CSR arrays of graph into a new shared memory block
+
+    :param graph: Graph to share
+    :return: Returns the shared memory block, the caller must close and unlink it
+    """
+    offsets_range, weights_range, destinations_range = _layout(len(graph), graph.number_of_edges)
+    memory = shared_memory.SharedMemory(create=True, size=max(destinations_range.stop, 1))
+    memory.buf[offsets_range] = array('q', graph.offsets).tobytes()
+    memory.buf[weights_range] = array('d', graph.weights).tobytes()
+    memory.buf[destinations_range] = array('i', graph.destinations).tobytes()
+    return memory
+
+
+def _attach_graph(name: str, number_of_nodes: int, number_of_edges: int) -> None:
+    """ Worker initializer, maps the shared CSR arrays into a CSRGraph without copying them
+
+    :param name: Name of the shared memory block
+    :param number_of_nodes: Number of nodes of the shared graph
+    :param number_of_edges: Number of edges of the shared graph
+    """
+    global _worker_graph, _worker_memory
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    offsets_range, weights_range, destinations_range = _layout(number_of_nodes, number_of_edges)
+    buffer = _worker_memory.buf
+    _worker_graph = CSRGraph(buffer[offsets_range].cast('q'), buffer[destinations_range].cast('i'),
+                             buffer[weights_range].cast('d'))
+
+
+def _dijkstra_batch(sources: List[int]) -> List[Tuple[int, array]]:
+    """ Runs dijkstra from every source on the attached graph
+
+    Distances travel back as typed arrays, which pickle as a single buffer
+    """
+    return [(source, array('d', dijkstra_shortest_path(_worker_graph, source))) for source in sources]
+
+
+def parallel_dijkstra(graph_object: BaseGraph, sources: Iterable[int], max_workers: int = None,
+                      chunk_size: int = 8) -> Iterator[Tuple[int, List[float]]]:
+    """ Runs ''dijkstra_shortest_path'' from many sources across a pool of processes
+
+    The graph is frozen into CSR form and its arrays are copied once into shared memory, which every worker maps
+    when it starts. Tasks only carry source nodes, so the graph is never pickled. Results are yielded as soon as
+    each batch finishes, so they arrive out of order.
+
+    :param graph_object: Either an adjacency list Graph or a frozen CSRGraph
+    :param sources: Start nodes
+    :param max_workers: Number of worker processes, defaults to the number of CPUs
+    :param chunk_size: Number of sources sent to a worker per task
+    :return: Yields (source, distances) pairs, distances are identical to dijkstra_shortest_path(graph, source)
+    """
+    if isinstance(graph_object, Graph):
+        graph_object = graph_object.freeze()
+    sources = list(sources)
+    batches = [sources[start:start + chunk_size] for start in range(0, len(sources), chunk_size)]
+
+    memory = _share_graph(graph_object)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach_graph,
+                                 initargs=(memory.name, len(graph_object), graph_object.number_of_edges)) as executor:
+            futures = [executor.submit(_dijkstra_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                for source, distances in future.result():
+                    yield source, distances.tolist()
+    finally:
+        memory.close()
+        memory.unlink()
@@ -1,8 +1,15 @@
+import random
 from math import inf
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
-from data_structures.graphs.algorithms import dijkstra_shortest_path, floyd_warshall
-from data_structures.graphs.base import Graph, Edge
+from data_structures.graphs.algorithms import dijkstra_shortest_path, floyd_warshall, floyd_warshall_vectorized, \
+    blocked_floyd_warshall, reconstruct_path, np, shortest_path, a_star_shortest_path, bidirectional_shortest_path, \
+    prim_mst_dense
+from data_structures.graphs.base import BaseGraph, Graph, Edge
+from data_structures.graphs.csr import CSRGraph
+from data_structures.graphs.parallel import parallel_dijkstra
+from data_structures.queues.bucket_queue import BucketQueue
+from data_structures.queues.priority_queue import IndexedMinHeap
 
 
 def graph_for_transversal():
@@ -40,6 +47,7 @@ class TestGraph(TestCase):
         g.add_edge(1, 4, 5)
 
         assert g.prim_mst_with_heap() == expected
+        assert g.prim_mst_with_heap(queue_class=BucketQueue) == expected
 
     def test_prim_mst(self):
         expected = set()
@@ -69,6 +77,46 @@ class TestGraph(TestCase):
 
         assert g.prim_mst() == expected
 
+    @skipIf(np is None, "numpy is not installed")
+    def test_prim_mst_dense(self):
+        g = Graph(5)
+        g.add_edges([(0, 1, 2), (0, 3, 6), (1, 2, 3), (1, 3, 8), (2, 4, 7), (3, 4, 9), (1, 4, 5)])
+        g.add_edges([(v, u, weight) for node_edges in list(g.graph.values()) for u, v, weight in node_edges])
+        assert g.prim_mst_dense() == [
+            Edge(source=0, destination=1, weight=2),
+            Edge(source=1, destination=2, weight=3),
+            Edge(source=1, destination=4, weight=5),
+            Edge(source=0, destination=3, weight=6),
+        ]
+
+    @skipIf(np is None, "numpy is not installed")
+    def test_prim_mst_dense_matches_kruskal(self):
+        rng = random.Random(3)
+        g = Graph(40)
+        for u in range(40):
+            for v in range(u + 1, 40):
+                weight = rng.randint(1, 1000)
+                g.add_edge(u, v, weight)
+                g.add_edge(v, u, weight)
+        result = g.prim_mst_dense()
+        assert len(result) == 39
+        assert sum(edge.weight for edge in result) == sum(edge.weight for edge in g.kruskal_mst())
+
+    @skipIf(np is None, "numpy is not installed")
+    def test_prim_mst_dense_from_matrix(self):
+        rng = np.random.RandomState(5)
+        matrix = rng.randint(1, 1000, size=(200, 200)).astype(np.float64)
+        matrix = np.minimum(matrix, matrix.T)
+        np.fill_diagonal(matrix, 0.0)
+        result = prim_mst_dense(matrix)
+        assert len(result) == 199
+        g = Graph(200)
+        g.add_edges_from_arrays(*(array.ravel().tolist() for array in np.nonzero(matrix)),
+                                weights=matrix[np.nonzero(matrix)].tolist())
+        assert sum(edge.weight for edge in result) == sum(edge.weight for edge in g.kruskal_mst())
+        # Only the component of node 0 is spanned
+        assert prim_mst_dense([[0.0, inf], [inf, 0.0]]) == []
+
     def test_kruskal_mst(self):
         g = Graph(4)
         g.add_edge(0, 1, 10)
@@ -82,6 +130,14 @@ class TestGraph(TestCase):
             Edge(source=0, destination=1, weight=10)
         ]
         assert g.kruskal_mst() == expected
+        assert g.kruskal_mst(lazy=True) == expected
+        assert g.freeze().kruskal_mst() == expected
+        assert g.freeze().kruskal_mst(lazy=True) == expected
+
+    def test_sort_edges_by_weight(self):
+        g = Graph(3)
+        g.add_edges([(0, 1, 3), (0, 2, 1), (1, 2, 3), (2, 0, 2)])
+        assert g.sort_edges_by_weight() == [Edge(0, 2, 1), Edge(2, 0, 2), Edge(0, 1, 3), Edge(1, 2, 3)]
 
     def test_cycle(self):
         """ Tests if the union-find algorithm for finding cycles is working
@@ -96,6 +152,87 @@ class TestGraph(TestCase):
         g.add_edge(1, 2)
         assert g.contains_cycle() is True
 
+    def test_add_edge_duplicate(self):
+        g = Graph()
+        g.add_edge(0, 1, 3)
+        g.add_edge(0, 1, 3)
+        g.add_edge(0, 1, 4)
+        assert g.graph[0] == [Edge(0, 1, 3), Edge(0, 1, 4)]
+
+    def test_add_edges(self):
+        g = Graph()
+        g.add_edges([(0, 1), (0, 2, 5), (0, 1), (1, 2, 2)])
+        assert g.graph[0] == [Edge(0, 1, 1), Edge(0, 2, 5)]
+        assert g.graph[1] == [Edge(1, 2, 2)]
+
+    def test_add_edges_without_deduplication(self):
+        g = Graph()
+        g.add_edges([(0, 1), (0, 1)], deduplicate=False)
+        assert g.graph[0] == [Edge(0, 1, 1), Edge(0, 1, 1)]
+        # The edge index is rebuilt for the next deduplicated add
+        g.add_edge(0, 1)
+        g.add_edge(0, 2)
+        assert g.graph[0] == [Edge(0, 1, 1), Edge(0, 1, 1), Edge(0, 2, 1)]
+
+    def test_add_edges_from_arrays(self):
+        g = Graph()
+        g.add_edges_from_arrays([0, 0, 1], [1, 2, 2], [2.0, 3.0, 4.0])
+        assert g.graph[0] == [Edge(0, 1, 2.0), Edge(0, 2, 3.0)]
+        assert g.graph[1] == [Edge(1, 2, 4.0)]
+
+    def test_add_edges_max_size(self):
+        g = Graph(3)
+        g.add_edges_from_arrays([0, 1], [1, 2])
+        with self.assertRaises(Exception):
+            g.add_edges([(1, 0), (2, 3)], deduplicate=False)
+        # The whole batch is rejected
+        assert g.graph[1] == [Edge(1, 2, 1)]
+        # Single adds follow the same rule, so a sized graph always survives the bulk path of reverse()
+        with self.assertRaises(Exception):
+            g.add_edge(3, 0)
+        g.add_edge(2, 0)
+        assert g.reverse().graph[0] == [Edge(0, 2, 1)]
+
+    def test_add_edges_bad_tuples(self):
+        g = Graph()
+        with self.assertRaises(ValueError):
+            g.add_edges([(0, 1), (0, 1, 5, 9)])
+        with self.assertRaises(ValueError):
+            g.add_edges([(0,)])
+        assert not g.graph
+
+    def test_adjacency_matrix_invalidation(self):
+        g = Graph(2)
+        g.add_edge(0, 1, 3)
+        assert g.adjacency_matrix == [[0.0, 3], [inf, 0.0]]
+        # Callers get copies, mutating one doesn't leak into the cache
+        matrix = g.adjacency_matrix
+        matrix[1][0] = 7
+        assert g.adjacency_matrix == [[0.0, 3], [inf, 0.0]]
+        g.add_edge(1, 0, 4)
+        assert g.adjacency_matrix == [[0.0, 3], [4, 0.0]]
+
+    def test_sparse_matrix(self):
+        g = Graph(3)
+        g.add_edges([(0, 1, 3), (0, 2, 1), (2, 1, 5)])
+        assert g.to_matrix('sparse') == {0: {1: 3, 2: 1}, 2: {1: 5}}
+
+    @skipIf(np is None, "numpy is not installed")
+    def test_numpy_matrix(self):
+        g = Graph(2)
+        g.add_edge(0, 1, 3)
+        assert g.to_matrix('numpy').tolist() == [[0.0, 3.0], [inf, 0.0]]
+        with self.assertRaises(ValueError):
+            g.to_matrix('numpy')[1, 0] = 7
+        # A read-only view can't be reused in place, so the cache is left alone
+        floyd_warshall_vectorized(g.to_matrix('numpy'), in_place=True)
+        assert g.to_matrix('numpy')[1, 0] == inf
+
+    def test_str(self):
+        g = Graph(3)
+        g.add_edges([(0, 1, 3), (0, 2, 1), (2, 1, 5)])
+        assert str(g) == "0 -> 1(3), 2(1)\n2 -> 1(5)"
+
     def test_bfs(self):
         g = graph_for_transversal()
         assert g.bfs(0) == [0, 1, 2, 5, 4, 3]
@@ -104,6 +241,89 @@ class TestGraph(TestCase):
         g = graph_for_transversal()
         assert g.recursive_dfs(0) == [0, 1, 2, 4, 3, 5]
 
+    def test_deep_dfs(self):
+        g = Graph()
+        g.add_edges(((node, node + 1) for node in range(100000)), deduplicate=False)
+        assert g.recursive_dfs(0) == list(range(100001))
+
+    def test_traversal_details(self):
+        g = graph_for_transversal()
+        assert list(g.iter_bfs(0, with_details=True)) == [
+            (0, 0, None), (1, 1, 0), (2, 1, 0), (5, 2, 1), (4, 2, 2), (3, 2, 2)]
+        assert list(g.iter_dfs(0, with_details=True)) == [
+            (0, 0, None), (1, 1, 0), (2, 2, 1), (4, 3, 2), (3, 3, 2), (5, 2, 1)]
+
+    def test_traversal_max_depth(self):
+        g = graph_for_transversal()
+        assert list(g.iter_bfs(0, max_depth=1)) == [0, 1, 2]
+        assert list(g.iter_dfs(0, max_depth=2)) == [0, 1, 2, 5]
+
+    def test_traversal_visitor(self):
+        g = graph_for_transversal()
+        seen = []
+
+        def visitor(node, depth, parent):
+            seen.append(node)
+            return node != 1
+
+        assert list(g.iter_dfs(0, visitor=visitor)) == [0, 1, 2, 4, 3]
+        assert seen == [0, 1, 2, 4, 3]
+
+    def test_traversal_early_termination(self):
+        g = graph_for_transversal()
+        traversal = g.iter_bfs(0)
+        assert next(traversal) == 0
+        assert next(traversal) == 1
+
+    def test_traversal_non_int_nodes(self):
+        g = Graph()
+        g.add_edges([("a", "b"), ("a", "c"), ("b", "d")])
+        assert list(g.iter_bfs("a")) == ["a", "b", "c", "d"]
+        assert list(g.iter_dfs("a")) == ["a", "b", "d", "c"]
+
+
+class TestCSRGraph(TestCase):
+    def test_freeze(self):
+        csr = graph_for_transversal().freeze()
+        assert len(csr) == 6
+        assert csr.number_of_edges == 10
+        assert list(csr.offsets) == [0, 2, 4, 7, 8, 9, 10]
+        assert list(csr.neighbours(2)) == [4, 0, 3]
+        assert list(csr.edges(1)) == [(1, 2, 1.0), (1, 5, 1.0)]
+
+    def test_from_edges(self):
+        g = graph_for_transversal()
+        sources = [e.source for node in g.graph for e in g.graph[node]]
+        destinations = [e.destination for node in g.graph for e in g.graph[node]]
+        csr = CSRGraph.from_edges(6, sources, destinations)
+        frozen = g.freeze()
+        assert csr.offsets == frozen.offsets
+        assert csr.destinations == frozen.destinations
+        assert csr.weights == frozen.weights
+
+    def test_traversals(self):
+        csr = graph_for_transversal().freeze()
+        assert csr.bfs(0) == [0, 1, 2, 5, 4, 3]
+        assert csr.recursive_dfs(0) == [0, 1, 2, 4, 3, 5]
+
+    def test_incomplete_subclass(self):
+        class EdgesOnly(BaseGraph):
+            def __len__(self):
+                return 0
+
+            def edges(self, u):
+                return []
+
+        with self.assertRaises(TypeError):
+            EdgesOnly()
+
+    def test_neighbours(self):
+        g = graph_for_transversal()
+        csr = g.freeze()
+        for node in range(len(csr)):
+            assert g.neighbours(node) == list(csr.neighbours(node)) == [v for _, v, _ in csr.edges(node)]
+        assert g.neighbours(100) == []
+
 
 class TestDijkstraShortestPath(TestCase):
     matrix = [
@@ -120,7 +340,74 @@ class TestDijkstraShortestPath(TestCase):
 
     def test_dijkstra_shortest_path(self):
         g = Graph.build(self.matrix)
-        assert dijkstra_shortest_path(g, 0) == [0.0, 4.0, 12.0, 19.0, 21.0, 11.0, 9.0, 8.0, 15.0]
+        assert dijkstra_shortest_path(g, 0) == [0.0, 4.0, 12.0, 19.0, 21.0, 11.0, 9.0, 8.0, 14.0]
+
+    def test_dijkstra_shortest_path_bucket_queue(self):
+        g = Graph.build(self.matrix)
+        assert dijkstra_shortest_path(g, 0, queue_class=BucketQueue) == dijkstra_shortest_path(g, 0)
+
+    def test_dijkstra_shortest_path_indexed_heap(self):
+        g = Graph.build(self.matrix)
+        assert dijkstra_shortest_path(g, 0, queue_class=IndexedMinHeap) == dijkstra_shortest_path(g, 0)
+
+    def test_dijkstra_shortest_path_csr(self):
+        g = Graph.build(self.matrix)
+        assert dijkstra_shortest_path(g.freeze(), 0) == dijkstra_shortest_path(g, 0)
+
+
+class TestParallelDijkstra(TestCase):
+    def test_parallel_dijkstra(self):
+        g = Graph.build(TestDijkstraShortestPath.matrix)
+        results = dict(parallel_dijkstra(g, range(len(g)), max_workers=2, chunk_size=2))
+        assert results == {source: dijkstra_shortest_path(g, source) for source in range(len(g))}
+
+
+class TestShortestPath(TestCase):
+    matrix = TestDijkstraShortestPath.matrix
+
+    def test_shortest_path(self):
+        g = Graph.build(self.matrix)
+        assert shortest_path(g, 0, 4) == (21.0, [0, 7, 6, 5, 4])
+        assert shortest_path(g, 0, 8) == (14.0, [0, 1, 2, 8])
+        assert shortest_path(g, 3, 3) == (0.0, [3])
+
+    def test_unreachable(self):
+        g = Graph(3)
+        g.add_edge(0, 1)
+        g.add_edge(2, 0)
+        assert shortest_path(g, 0, 2) == (inf, [])
+        assert bidirectional_shortest_path(g, 0, 2) == (inf, [])
+
+    def test_a_star(self):
+        g = Graph.build(self.matrix)
+        # A zero heuristic is always admissible, a lower bound from the exact distances is too
+        assert a_star_shortest_path(g, 0, 4, lambda node: 0) == (21.0, [0, 7, 6, 5, 4])
+        exact = floyd_warshall(g.adjacency_matrix, in_place=False)
+        assert a_star_shortest_path(g, 0, 4, lambda node: exact[node][4] / 2)[0] == 21.0
+
+    def test_bidirectional_shortest_path(self):
+        g = Graph.build(self.matrix)
+        for graph in (g, g.freeze()):
+            expected = dijkstra_shortest_path(graph, 0)
+            reverse_graph = graph.reverse()
+            for target in range(len(g)):
+                distance, path = bidirectional_shortest_path(graph, 0, target, reverse_graph)
+                assert distance == expected[target]
+                assert path[0] == 0 and path[-1] == target
+                assert sum(g.adjacency_matrix[u][v] for u, v in zip(path, path[1:])) == distance
+
+    def test_random_graphs(self):
+        rng = random.Random(7)
+        for _ in range(20):
+            g = Graph(30)
+            g.add_edges((rng.randrange(30), rng.randrange(30), rng.randint(0, 9)) for _ in range(80))
+            expected = dijkstra_shortest_path(g, 0)
+            for target in range(30):
+                assert shortest_path(g, 0, target)[0] == expected[target]
+                assert shortest_path(g, 0, target, queue_class=BucketQueue)[0] == expected[target]
+                assert shortest_path(g, 0, target, queue_class=IndexedMinHeap)[0] == expected[target]
+                assert bidirectional_shortest_path(g, 0, target)[0] == expected[target]
+                assert bidirectional_shortest_path(g, 0, target, queue_class=BucketQueue)[0] == expected[target]
 
 
 class TestFloydWarshall(TestCase):
@@ -141,3 +428,49 @@ class TestFloydWarshall(TestCase):
     def test_floyd_warshall(self):
         g = Graph.build(self.input_matrix)
         assert floyd_warshall(g.adjacency_matrix) == self.expected
+        assert g.adjacency_matrix == self.input_matrix
+
+    def test_floyd_warshall_in_place(self):
+        matrix = [list(row) for row in self.input_matrix]
+        assert floyd_warshall(matrix, in_place=True) is matrix
+        assert matrix == self.expected
+
+    def test_floyd_warshall_copy(self):
+        g = Graph.build(self.input_matrix)
+        matrix = g.adjacency_matrix
+        assert floyd_warshall(matrix) == self.expected
+        assert matrix[0][2] == inf
+
+
+@skipIf(np is None, "numpy is not installed")
+class TestVectorizedFloydWarshall(TestCase):
+    input_matrix = TestFloydWarshall.input_matrix
+    expected = TestFloydWarshall.expected
+
+    def test_floyd_warshall_vectorized(self):
+        distances, predecessors = floyd_warshall_vectorized(self.input_matrix)
+        assert distances.tolist() == self.expected
+        assert reconstruct_path(predecessors, 0, 3) == [0, 1, 2, 3]
+        assert reconstruct_path(predecessors, 3, 0) == []
+        # The caller's matrix is left intact
+        assert self.input_matrix[0][2] == inf
+
+    def test_floyd_warshall_vectorized_in_place(self):
+        matrix = np.array(self.input_matrix)
+        distances, _ = floyd_warshall_vectorized(matrix, in_place=True)
+        assert distances is matrix
+        assert matrix.tolist() == self.expected
+
+    def test_blocked_floyd_warshall(self):
+        distances, predecessors = blocked_floyd_warshall(self.input_matrix, block_size=3)
+        assert distances.tolist() == self.expected
+        assert reconstruct_path(predecessors, 0, 3) == [0, 1, 2, 3]
+
+    def test_blocked_matches_vectorized(self):
+        g = Graph.build(TestDijkstraShortestPath.matrix)
+        expected, _ = floyd_warshall_vectorized(g.adjacency_matrix)
+        for block_size in (1, 2, 4, 9):
+            distances, predecessors = blocked_floyd_warshall(g.adjacency_matrix, block_size=block_size)
+            assert (distances == expected).all()
+            path = reconstruct_path(predecessors, 0, 4)
+            assert sum(g.adjacency_matrix[u][v] for u, v in zip(path, path[1:])) == distances[0][4]
@@ -0,0 +1,136 @@
+from typing import Any, Iterable, Iterator
+
+from data_structures.linked_lists.linked_list import InvalidOperation
+
+
+class DoublyLinkedNode(object):
+    """Node of a doubly linked list
+
+    Plain slots instead of properties, the list updates them on every move
+    """
+    __slots__ = ('value', 'next', 'previous')
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+        self.next = None  # type: DoublyLinkedNode
+        self.previous = None  # type: DoublyLinkedNode
+
+    def __str__(self):
+        return "DoublyLinkedNode({0})".format(str(self.value))
+
+    def __repr__(self):
+        return str(self.__str__())
+
+
+class DoublyLinkedList(object):
+    """Doubly linked list
+
+    append and push return the new node, and that handle can later be removed or moved to the front in O(1).
+    The nodes form a ring through a sentinel node, so no operation has to special case the ends of the list,
+    and the length is kept up to date.
+
+    Interface:
+        * append/push
+        * remove/move_to_front
+        * pop_head/pop_tail
+    """
+
+    def __init__(self, values: Iterable[Any] = None) -> None:
+        self._sentinel = DoublyLinkedNode(None)
+        self._sentinel.next = self._sentinel.previous = self._sentinel
+        self._length = 0
+        if values:
+            for value in values:
+                self.append(value)
+
+    @property
+    def head(self) -> DoublyLinkedNode:
+        return None if self._length == 0 else self._sentinel.next
+
+    @property
+    def tail(self) -> DoublyLinkedNode:
+        return None if self._length == 0 else self._sentinel.previous
+
+    def __iter__(self) -> Iterator[DoublyLinkedNode]:
+        sentinel = self._sentinel
+        current = sentinel.next
+        while current is not sentinel:
+            yield current
+            current = current.next
+
+    def __str__(self):
+        values = [str(x) for x in self]
+        return ' -> '.join(values)
+
+    def __len__(self):
+        return self._length
+
+    def _link_after(self, node: DoublyLinkedNode, previous: DoublyLinkedNode) -> None:
+        following = previous.next
+        node.previous = previous
+        node.next = following
+        previous.next = following.previous = node
+
+    def append(self, value: Any) -> DoublyLinkedNode:
+        node = DoublyLinkedNode(value)
+        self._link_after(node, self._sentinel.previous)
+        self._length += 1
+        return node
+
+    def push(self, value: Any) -> DoublyLinkedNode:
+        node = DoublyLinkedNode(value)
+        self._link_after(node, self._sentinel)
+        self._length += 1
+        return node
+
+    def remove(self, node: DoublyLinkedNode) -> Any:
+        """Removes a node of this list in O(1)
+
+        :param node: Node returned by append or push
+        :return: Returns the node's value
+        """
+        node.previous.next = node.next
+        node.next.previous = node.previous
+        node.next = node.previous = None
+        self._length -= 1
+        return node.value
+
+    def move_to_front(self, node: DoublyLinkedNode) -> None:
+        """Moves a node of this list to the head in O(1)
+
+        :param node: Node returned by append or push
+        """
+        if self._sentinel.next is node:
+            return
+        node.previous.next = node.next
+        node.next.previous = node.previous
+        self._link_after(node, self._sentinel)
+
+    def pop_head(self) -> Any:
+        if not self._length:
+            raise InvalidOperation("List is Empty")
+        return self.remove(self._sentinel.next)
+
+    def pop_tail(self) -> Any:
+        if not self._length:
+            raise InvalidOperation("List is Empty")
+        return self.remove(self._sentinel.previous)
+
+    @classmethod
+    def build(cls, values):
+        return cls(values)
+
+    def serialize(self):
+        return [n.value for n in self]
+
+    def __eq__(self, other):
+        """Override the default Equals behavior"""
+        if isinstance(other, self.__class__):
+            if len(self) != len(other):
+                return False
+            return all(mine.value == theirs.value for mine, theirs in zip(self, other))
+        return False
+
+    def __ne__(self, other):
+        """Define a non-equality test"""
+        return not self.__eq__(other)
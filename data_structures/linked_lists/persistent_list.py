@@ -0,0 +1,118 @@
+from typing import Any, Iterable, Iterator, Tuple
+
+from data_structures.linked_lists.linked_list import InvalidOperation
+
+
+class ConsNode(object):
+    """Node of a persistent list
+
+    Never changes once built, so any number of lists can share it. Also knows the length of the list it starts.
+    """
+    __slots__ = ('value', 'next', 'length')
+
+    def __init__(self, value: Any, next: 'ConsNode' = None) -> None:
+        self.value = value
+        self.next = next
+        self.length = 1 if next is None else next.length + 1
+
+    def __str__(self):
+        return "ConsNode({0})".format(str(self.value))
+
+    def __repr__(self):
+        return str(self.__str__())
+
+
+class PersistentList(object):
+    """Immutable singly linked list
+
+    Operations return new lists instead of changing this one, and the new lists share every node they have in
+    common with it: push, pop and tail are O(1) in time and memory, so keeping many versions is cheap. Nodes cache
+    the length of their list, so len() is O(1) for every version, and iteration walks the nodes with a loop.
+
+    Interface:
+        * push/pop/tail/peek
+        * get/search
+    """
+    __slots__ = ('head',)
+
+    def __init__(self, values: Iterable[Any] = None, _head: ConsNode = None) -> None:
+        """Constructor
+
+        :param values: Values of the list, the first one ends up at the head
+        """
+        head = _head
+        if values:
+            for value in reversed(list(values)):
+                head = ConsNode(value, head)
+        self.head = head
+
+    def __iter__(self) -> Iterator[Any]:
+        current = self.head
+        while current is not None:
+            yield current.value
+            current = current.next
+
+    def __str__(self):
+        values = [str(x) for x in self]
+        return ' -> '.join(values)
+
+    def __len__(self):
+        return 0 if self.head is None else self.head.length
+
+    def push(self, value: Any) -> 'PersistentList':
+        """Returns a new list with value in front of this one"""
+        return PersistentList(_head=ConsNode(value, self.head))
+
+    def peek(self) -> Any:
+        if self.head is None:
+            raise InvalidOperation("List is Empty")
+        return self.head.value
+
+    def tail(self) -> 'PersistentList':
+        """Returns the list without its first value"""
+        if self.head is None:
+            raise InvalidOperation("List is Empty")
+        return PersistentList(_head=self.head.next)
+
+    def pop(self) -> Tuple[Any, 'PersistentList']:
+        """Returns the first value and the list without it"""
+        return self.peek(), self.tail()
+
+    def get(self, pos):
+        if not 0 <= pos < len(self):
+            raise InvalidOperation("Invalid Get() operation - list only has {} nodes".format(len(self)))
+        pointer = self.head
+        for _ in range(pos):
+            pointer = pointer.next
+        return pointer.value
+
+    @classmethod
+    def build(cls, values):
+        return cls(values)
+
+    def serialize(self):
+        return list(self)
+
+    def __eq__(self, other):
+        """Override the default Equals behavior"""
+        if isinstance(other, self.__class__):
+            if len(self) != len(other):
+                return False
+            mine, theirs = self.head, other.head
+            # Shared nodes end both lists the same way
+            while mine is not theirs:
+                if mine.value != theirs.value:
+                    return False
+                mine, theirs = mine.next, theirs.next
+            return True
+        return False
+
+    def __ne__(self, other):
+        """Define a non-equality test"""
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def search(self, item):
+        return any(value == item for value in self)
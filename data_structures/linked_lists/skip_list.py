@@ -0,0 +1,219 @@
+from random import Random
+from typing import Any, Iterable, Iterator, List
+
+from data_structures.linked_lists.linked_list import InvalidOperation
+
+
+class SkipListNode(object):
+    """Node of a skip list
+
+    Has one forward pointer per level, and the number of level 0 steps every one of them skips
+    """
+    __slots__ = ('value', 'next', 'widths')
+
+    def __init__(self, value: Any, height: int) -> None:
+        self.value = value
+        self.next = [None] * height  # type: List[SkipListNode]
+        self.widths = [1] * height  # type: List[int]
+
+    def __str__(self):
+        return "SkipListNode({0})".format(str(self.value))
+
+    def __repr__(self):
+        return str(self.__str__())
+
+
+class SkipList(object):
+    """Sorted skip list
+
+    Level 0 links every value in ascending order, and every node also appears on each level above with
+    probability 1/2, so every search skips about half the remaining values per level and insert, delete, search,
+    rank and positional access are expected O(log(n)). Links store how many values they skip, which gives ranks
+    and positions. Equal values are kept in insertion order.
+
+    The levels come from a private random generator, so a seed gives the same structure, and timings, every run.
+
+    Interface:
+        * insert/delete
+        * search/rank/get
+        * iter_range
+    """
+
+    MAX_LEVEL = 32
+    PROBABILITY = 0.5
+
+    def __init__(self, values: Iterable[Any] = None, seed: Any = None) -> None:
+        """Constructor
+
+        :param values: Values to insert
+        :param seed: Seed of the level generator
+        """
+        self._random = Random(seed)
+        self._head = SkipListNode(None, self.MAX_LEVEL)
+        self._levels = 1
+        self._length = 0
+        if values:
+            for value in values:
+                self.insert(value)
+
+    def __iter__(self) -> Iterator[Any]:
+        current = self._head.next[0]
+        while current is not None:
+            yield current.value
+            current = current.next[0]
+
+    def __str__(self):
+        values = [str(x) for x in self]
+        return ' -> '.join(values)
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, item):
+        return self.search(item)
+
+    def _random_height(self) -> int:
+        height, random, probability = 1, self._random.random, self.PROBABILITY
+        while height < self.MAX_LEVEL and random() < probability:
+            height += 1
+        return height
+
+    def _predecessors(self, value: Any) -> List[SkipListNode]:
+        """Finds the last node before value on every level in use"""
+        chain = [None] * self._levels  # type: List[SkipListNode]
+        node = self._head
+        for level in range(self._levels - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and following.value < value:
+                node = following
+                following = node.next[level]
+            chain[level] = node
+        return chain
+
+    def insert(self, value: Any) -> None:
+        """Inserts value after the values lower or equal to it, expected O(log(n))"""
+        height = self._random_height()
+        head = self._head
+        while self._levels < height:
+            # Links to the end of the list skip every value
+            head.widths[self._levels] = self._length + 1
+            self._levels += 1
+
+        levels = self._levels
+        chain = [None] * levels  # type: List[SkipListNode]
+        steps_at_level = [0] * levels
+        node = head
+        for level in range(levels - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and following.value <= value:
+                steps_at_level[level] += node.widths[level]
+                node = following
+                following = node.next[level]
+            chain[level] = node
+
+        new_node = SkipListNode(value, height)
+        steps = 0
+        for level in range(height):
+            previous = chain[level]
+            new_node.next[level] = previous.next[level]
+            previous.next[level] = new_node
+            new_node.widths[level] = previous.widths[level] - steps
+            previous.widths[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(height, levels):
+            chain[level].widths[level] += 1
+        self._length += 1
+
+    def delete(self, value: Any) -> None:
+        """Deletes the first occurrence of value, expected O(log(n))
+
+        Raise InvalidOperation if value isn't in the list
+        """
+        chain = self._predecessors(value)
+        target = chain[0].next[0]
+        if target is None or target.value != value:
+            raise InvalidOperation("Delete of {} impossible, it isn't in the list".format(value))
+
+        height = len(target.next)
+        for level in range(height):
+            previous = chain[level]
+            previous.widths[level] += target.widths[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(height, self._levels):
+            chain[level].widths[level] -= 1
+        self._length -= 1
+        while self._levels > 1 and self._head.next[self._levels - 1] is None:
+            self._levels -= 1
+
+    def search(self, item: Any) -> bool:
+        following = self._predecessors(item)[0].next[0]
+        return following is not None and following.value == item
+
+    def rank(self, value: Any) -> int:
+        """Counts the values lower than value, which is the position value has or would be inserted at
+
+        :param value: Value to rank, it doesn't need to be in the list
+        :return: Returns the number of values lower than value
+        """
+        rank = 0
+        node = self._head
+        for level in range(self._levels - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and following.value < value:
+                rank += node.widths[level]
+                node = following
+                following = node.next[level]
+        return rank
+
+    def get(self, pos: int) -> Any:
+        """Returns the value at position pos in sorted order, expected O(log(n))
+
+        Raise InvalidOperation if pos is out of range
+        """
+        if not 0 <= pos < self._length:
+            raise InvalidOperation("Invalid Get() operation - list only has {} values".format(self._length))
+        remaining = pos + 1
+        node = self._head
+        for level in range(self._levels - 1, -1, -1):
+            while node.widths[level] <= remaining:
+                remaining -= node.widths[level]
+                node = node.next[level]
+        return node.value
+
+    def __getitem__(self, pos: int) -> Any:
+        if pos < 0:
+            pos += self._length
+        try:
+            return self.get(pos)
+        except InvalidOperation:
+            raise IndexError("SkipList index out of range")
+
+    def iter_range(self, start: Any = None, stop: Any = None) -> Iterator[Any]:
+        """Yields the values in [start, stop) in ascending order
+
+        :param start: Lowest value yielded, None starts from the lowest value
+        :param stop: Values from stop on aren't yielded, None goes to the end
+        """
+        current = self._head.next[0] if start is None else self._predecessors(start)[0].next[0]
+        while current is not None and (stop is None or current.value < stop):
+            yield current.value
+            current = current.next[0]
+
+    @classmethod
+    def build(cls, values):
+        return cls(values)
+
+    def serialize(self):
+        return list(self)
+
+    def __eq__(self, other):
+        """Override the default Equals behavior"""
+        if isinstance(other, self.__class__):
+            if len(self) != len(other):
+                return False
+            return all(mine == theirs for mine, theirs in zip(self, other))
+        return False
+
+    def __ne__(self, other):
+        """Define a non-equality test"""
+        return not self.__eq__(other)
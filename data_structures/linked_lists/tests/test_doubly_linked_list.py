@@ -0,0 +1,23 @@
+from unittest import TestCase
+
+from data_structures.linked_lists.doubly_linked_list import DoublyLinkedList
+from data_structures.linked_lists.linked_list import InvalidOperation
+
+
+class TestDoublyLinkedList(TestCase):
+    def test_node_handles(self):
+        values = DoublyLinkedList([2, 3])
+        one = values.push(1)
+        four = values.append(4)
+        assert values.serialize() == [1, 2, 3, 4]
+        assert values.head is one and values.tail is four
+        values.move_to_front(four)
+        assert values.serialize() == [4, 1, 2, 3]
+        assert values.remove(one) == 1
+        assert values.pop_tail() == 3
+        assert values.pop_head() == 4
+        assert values == DoublyLinkedList.build([2])
+        assert len(values) == 1
+        assert values.pop_tail() == 2
+        assert values.head is None and values.tail is None
+        self.assertRaises(InvalidOperation, values.pop_tail)
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from data_structures.linked_lists.linked_list import InvalidOperation
+from data_structures.linked_lists.persistent_list import PersistentList
+
+
+class TestPersistentList(TestCase):
+    def test_versions_share_structure(self):
+        base = PersistentList([2, 3])
+        pushed = base.push(1)
+        value, rest = pushed.pop()
+        assert value == 1 and rest.head is base.head
+        assert pushed.serialize() == [1, 2, 3]
+        assert base.serialize() == [2, 3]
+        assert base.tail().serialize() == [3]
+        assert len(pushed) == 3 and pushed.get(2) == 3
+        assert pushed.search(3) and not pushed.search(4)
+        assert rest == base and rest == PersistentList.build([2, 3])
+        assert base.push(0) != pushed
+        assert hash(rest) == hash(base)
+        empty = base.tail().tail()
+        assert len(empty) == 0
+        self.assertRaises(InvalidOperation, empty.pop)
+
+    def test_long_list(self):
+        values = PersistentList()
+        for value in range(200000):
+            values = values.push(value)
+        assert len(values) == 200000
+        assert sum(values) == sum(range(200000))
+        assert values == values.tail().push(199999)
+        del values
@@ -0,0 +1,52 @@
+import random
+from bisect import bisect_left, insort_right
+from unittest import TestCase
+
+from data_structures.linked_lists.linked_list import InvalidOperation
+from data_structures.linked_lists.skip_list import SkipList
+
+
+class TestSkipList(TestCase):
+    def test_sorted_operations(self):
+        values = SkipList([5, 1, 4, 1, 3], seed=1)
+        assert values.serialize() == [1, 1, 3, 4, 5]
+        assert 4 in values and 2 not in values
+        assert values.rank(3) == 2
+        assert values.rank(10) == 5
+        assert values.get(2) == 3
+        assert values[-1] == 5
+        assert list(values.iter_range(2, 5)) == [3, 4]
+        assert list(values.iter_range(stop=3)) == [1, 1]
+        values.delete(1)
+        assert values.serialize() == [1, 3, 4, 5]
+        self.assertRaises(InvalidOperation, values.delete, 2)
+        self.assertRaises(IndexError, values.__getitem__, 4)
+
+    def test_seed_is_deterministic(self):
+        first, second = SkipList(range(100), seed=3), SkipList(range(100), seed=3)
+        assert first._levels == second._levels
+        assert [len(node.next) for node in _nodes(first)] == [len(node.next) for node in _nodes(second)]
+
+    def test_matches_sorted_list(self):
+        rng = random.Random(5)
+        values, expected = SkipList(seed=5), list()
+        for step in range(3000):
+            value = rng.randrange(500)
+            if rng.random() < 0.6 or not expected:
+                values.insert(value)
+                insort_right(expected, value)
+            elif value in expected:
+                values.delete(value)
+                expected.remove(value)
+            if step % 300 == 0:
+                assert values.serialize() == expected
+                assert values.rank(value) == bisect_left(expected, value)
+        assert len(values) == len(expected)
+        assert [values.get(pos) for pos in range(len(expected))] == expected
+
+
+def _nodes(skip_list):
+    node = skip_list._head.next[0]
+    while node is not None:
+        yield node
+        node = node.next[0]
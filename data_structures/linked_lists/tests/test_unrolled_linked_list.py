@@ -0,0 +1,49 @@
+import random
+from unittest import TestCase
+
+from data_structures.linked_lists.linked_list import InvalidOperation
+from data_structures.linked_lists.unrolled_linked_list import UnrolledLinkedList
+
+
+class TestUnrolledLinkedList(TestCase):
+    def test_linked_list_api(self):
+        values = UnrolledLinkedList([2, 3])
+        values.push(1)
+        values.append(5)
+        values.insert(4, 2)
+        assert values.serialize() == [1, 2, 3, 4, 5]
+        assert str(values) == "1 -> 2 -> 3 -> 4 -> 5"
+        assert len(values) == 5
+        assert values.get(3) == 4
+        values.delete(0)
+        assert values.search(2)
+        assert not values.search(1)
+        assert values == UnrolledLinkedList.build([2, 3, 4, 5])
+        assert values != UnrolledLinkedList.build([2, 3, 4, 6])
+        self.assertRaises(InvalidOperation, values.get, 4)
+        self.assertRaises(InvalidOperation, values.delete, 4)
+        self.assertRaises(InvalidOperation, UnrolledLinkedList().insert, 1, 0)
+
+    def test_matches_list(self):
+        rng = random.Random(7)
+        values, expected = UnrolledLinkedList(typecode='q'), list()
+        for step in range(5000):
+            operation = rng.random()
+            if operation < 0.3 or not expected:
+                values.append(step)
+                expected.append(step)
+            elif operation < 0.4:
+                values.push(step)
+                expected.insert(0, step)
+            elif operation < 0.7:
+                pos = rng.randrange(len(expected))
+                values.insert(step, pos)
+                expected.insert(pos + 1, step)
+            else:
+                pos = rng.randrange(len(expected))
+                values.delete(pos)
+                del expected[pos]
+            if step % 500 == 0:
+                assert values.serialize() == expected
+        assert len(values) == len(expected)
+        assert [values.get(pos) for pos in range(len(expected))] == expected
@@ -0,0 +1,197 @@
+from array import array
+from math import sqrt
+from typing import Any, Iterable, Iterator, List, Tuple, Union
+
+from data_structures.linked_lists.linked_list import InvalidOperation
+
+
+class UnrolledNode(object):
+    """Node of an unrolled linked list
+
+    Holds a small contiguous block of values instead of a single one
+    """
+    __slots__ = ('values', 'next')
+
+    def __init__(self, values: Union[List[Any], array]) -> None:
+        self.values = values
+        self.next = None  # type: UnrolledNode
+
+    def __str__(self):
+        return "UnrolledNode({0})".format(list(self.values))
+
+    def __repr__(self):
+        return str(self.__str__())
+
+
+class UnrolledLinkedList(object):
+    """Unrolled linked list
+
+    Has the public API of LinkedList, but every node stores a block of values and the list keeps its length, so
+    len() is O(1). Blocks hold up to about sqrt(n) values: a full block is split in two and a block that empties
+    below a quarter of that is merged with the next one, so there are O(sqrt(n)) blocks and get, insert and delete
+    skip whole blocks by their counts in O(sqrt(n)). Equality stops at the first mismatch.
+
+    Unlike LinkedList, iterating yields values, as there is no node per value, and append/push return nothing.
+    With a typecode the blocks are ``array.array`` objects of that type, which store numbers unboxed.
+    """
+
+    MIN_BLOCK_SIZE = 16
+
+    def __init__(self, values: Iterable[Any] = None, typecode: str = None) -> None:
+        self.typecode = typecode
+        self.head = None  # type: UnrolledNode
+        self.tail = None  # type: UnrolledNode
+        self._length = 0
+        if values:
+            for value in values:
+                self.append(value)
+
+    def __iter__(self) -> Iterator[Any]:
+        current = self.head
+        while current:
+            yield from current.values
+            current = current.next
+
+    def __str__(self):
+        values = [str(x) for x in self]
+        return ' -> '.join(values)
+
+    def __len__(self):
+        return self._length
+
+    def _block_size(self) -> int:
+        return max(self.MIN_BLOCK_SIZE, int(sqrt(self._length)))
+
+    def _new_node(self, values: Iterable[Any] = ()) -> UnrolledNode:
+        if self.typecode is None:
+            return UnrolledNode(list(values))
+        return UnrolledNode(array(self.typecode, values))
+
+    def _locate(self, pos: int) -> Tuple[UnrolledNode, UnrolledNode, int]:
+        """Finds the block holding position pos, which must be in range
+
+        :return: Returns the previous block (None for the head), the block and the offset of pos inside it
+        """
+        previous, current = None, self.head
+        while pos >= len(current.values):
+            pos -= len(current.values)
+            previous, current = current, current.next
+        return previous, current, pos
+
+    def append(self, value):
+        if self.tail is None:
+            self.head = self.tail = self._new_node()
+        elif len(self.tail.values) >= self._block_size():
+            self.tail.next = self._new_node()
+            self.tail = self.tail.next
+        self.tail.values.append(value)
+        self._length += 1
+
+    def push(self, value):
+        if self.head is None:
+            self.head = self.tail = self._new_node()
+        elif len(self.head.values) >= self._block_size():
+            new_node = self._new_node()
+            new_node.next = self.head
+            self.head = new_node
+        self.head.values.insert(0, value)
+        self._length += 1
+
+    def insert(self, value, pos):
+        """Inserts value after position pos, like LinkedList.insert"""
+        if not self.head:
+            raise InvalidOperation("List is Empty")
+        if not 0 <= pos < self._length:
+            raise InvalidOperation("Insert after position {} impossible, list only has {} nodes".format(
+                pos, self._length))
+        if pos == self._length - 1:
+            self.append(value)
+            return
+
+        _, current, offset = self._locate(pos + 1)
+        current.values.insert(offset, value)
+        self._length += 1
+        if len(current.values) > self._block_size():
+            self._split(current)
+
+    def delete(self, pos):
+        if not self.head:
+            raise InvalidOperation("List is Empty")
+        if not 0 <= pos < self._length:
+            raise InvalidOperation(
+                "Delete from position {} impossible,"
+                " list only has {} nodes".format(pos, self._length))
+
+        previous, current, offset = self._locate(pos)
+        del current.values[offset]
+        self._length -= 1
+        if not current.values:
+            self._unlink(previous, current)
+        elif len(current.values) < self._block_size() // 4:
+            self._merge_next(current)
+
+    def get(self, pos):
+        if not self.head:
+            raise InvalidOperation("Invalid Get() operation - Empty List")
+        if not 0 <= pos < self._length:
+            raise InvalidOperation("Invalid Get() operation - list only has {} nodes".format(self._length))
+        tail_start = self._length - len(self.tail.values)
+        if pos >= tail_start:
+            return self.tail.values[pos - tail_start]
+        _, current, offset = self._locate(pos)
+        return current.values[offset]
+
+    def _split(self, current: UnrolledNode) -> None:
+        """Moves the second half of a block into a new block right after it"""
+        half = len(current.values) // 2
+        new_node = self._new_node(current.values[half:])
+        del current.values[half:]
+        new_node.next = current.next
+        current.next = new_node
+        if current is self.tail:
+            self.tail = new_node
+
+    def _unlink(self, previous: UnrolledNode, current: UnrolledNode) -> None:
+        if previous is None:
+            self.head = current.next
+        else:
+            previous.next = current.next
+        if current is self.tail:
+            self.tail = previous
+
+    def _merge_next(self, current: UnrolledNode) -> None:
+        """Moves the values of the next block into current when they fit in one block"""
+        following = current.next
+        if following is not None and len(current.values) + len(following.values) <= self._block_size():
+            current.values.extend(following.values)
+            self._unlink(current, following)
+
+    @classmethod
+    def build(cls, values):
+        l = cls()
+        for v in values:
+            l.append(v)
+        return l
+
+    def serialize(self):
+        return list(self)
+
+    def __eq__(self, other):
+        """Override the default Equals behavior"""
+        if isinstance(other, self.__class__):
+            if len(self) != len(other):
+                return False
+            return all(mine == theirs for mine, theirs in zip(self, other))
+        return False
+
+    def __ne__(self, other):
+        """Define a non-equality test"""
+        return not self.__eq__(other)
+
+    def search(self, item):
+        current = self.head
+        while current is not None:
+            if item in current.values:
+                return True
+            current = current.next
+        return False
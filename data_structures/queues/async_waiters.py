@@ -0,0 +1,68 @@
+import asyncio
+from collections import deque
+from typing import Callable
+
+
+class AsyncWaiters(object):
+    """ FIFO of coroutines waiting for a condition of an asyncio queue, e.g. items to pop or room to push
+
+        ``wait_until`` parks the calling coroutine on a future until its condition holds. The queue resolves those
+        futures with ``wake_up_next`` or ``wake_up_all`` whenever it may have made the condition true, and every
+        woken coroutine checks its condition again. Must only be used from the event loop thread.
+    """
+
+    def __init__(self) -> None:
+        self._waiters = deque()  # type: deque
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+    def wake_up_next(self) -> None:
+        """ Resolves the oldest pending waiter """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def wake_up_all(self) -> None:
+        """ Resolves every pending waiter, for when they wait for different amounts of the same resource """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait_until(self, ready: Callable[[], bool], timeout: float, error: type) -> None:
+        """ Waits until ready() is true
+
+        Raise error if ready() is still false after timeout seconds
+
+        :param ready: Condition to wait for
+        :param timeout: Seconds to wait, None waits forever
+        :param error: Exception class raised on timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not ready():
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                raise error
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                self._discard(waiter)
+                raise error
+            except BaseException:
+                self._discard(waiter)
+                raise
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        """ Forgets a waiter that gave up, handing its wake up over to the next one if it already got it """
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        if waiter.done() and not waiter.cancelled():
+            self.wake_up_next()
@@ -0,0 +1,136 @@
+from collections import deque
+from itertools import count
+from typing import Dict, Generic, List
+
+from data_structures.queues.priority_queue import Priority, PriorityInput, T, _priority_pairs
+
+
+class BucketQueue(Generic[T]):
+    """ Implements a bucket priority queue for small non negative integer priorities (Dial's algorithm)
+
+        Every priority has a FIFO bucket, and a cursor points at the lowest bucket that may hold items. Push is O(1),
+        and so is pop while the bucket under the cursor has live entries. Once it runs out the cursor jumps to the
+        lowest remaining bucket with min(), which scans every live bucket, so a whole run costs O(E + B * L) where B
+        is the number of buckets emptied and L the number of live buckets at the time. That stays small when the
+        priorities in the queue span a narrow range, like the distances of Dijkstra's algorithm with small weights.
+        Pushing below the cursor is allowed and just moves it back, so Prim's algorithm works too.
+
+        Updating an item leaves its old entry behind in its bucket, it is skipped when the cursor reaches it.
+        Shares the push/pop/peek/contains_item interface of MinHeap, so graph algorithms can use it as their queue.
+    """
+
+    def __init__(self) -> None:
+        self._access_counter = count()
+        self._buckets = dict()  # type: Dict[int, deque]
+        self._counters = dict()  # type: Dict[T, int]  # Access counter of the live entry of every item
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def push(self, item: T, priority: Priority = 0) -> None:
+        """ Pushes/updates an item into/in the priority queue in O(1)
+
+        Raise ValueError if priority isn't a non negative integer
+
+        :param item: What will be the added to the priority queue
+        :param priority: the item's priority, floats are accepted when they hold an integer value
+        """
+        bucket_index = int(priority)
+        if bucket_index != priority or bucket_index < 0:
+            raise ValueError("BucketQueue priorities must be non negative integers, got {0}".format(priority))
+        access_counter = next(self._access_counter)
+        self._counters[item] = access_counter
+
+        bucket = self._buckets.get(bucket_index)
+        if bucket is None:
+            bucket = self._buckets[bucket_index] = deque()
+        bucket.append((access_counter, item))
+        if bucket_index < self._cursor:
+            self._cursor = bucket_index
+
+    def push_many(self, input_elements: PriorityInput) -> None:
+        """ Pushes/updates many items
+
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
+        """
+        for item, priority in _priority_pairs(input_elements):
+            self.push(item, priority)
+
+    def heapify(self, input_elements: PriorityInput) -> None:
+        self.push_many(input_elements)
+
+    @classmethod
+    def build(cls, input_elements: PriorityInput) -> 'BucketQueue':
+        """ Builds the priority queue from (item, priority) pairs
+
+        :param input_elements:
+        :return: Returns the new BucketQueue object
+        """
+        new_queue = cls()
+        new_queue.push_many(input_elements)
+        return new_queue
+
+    def remove_task(self, item: T) -> None:
+        """ Removes an item, its entry is dropped when the cursor reaches its bucket
+
+        Raise KeyError if not found.
+
+        :param item: Item to remove
+        """
+        del self._counters[item]
+
+    def contains_item(self, item: T) -> bool:
+        return item in self._counters
+
+    def pop(self) -> T:
+        """ Pops the item with the lowest priority, items with equal priorities come out in push order
+
+        Raise KeyError if the priority queue is empty
+
+        :return:
+        """
+        bucket = self._first_live_bucket()
+        _, item = bucket.popleft()
+        del self._counters[item]
+        return item
+
+    def peek(self) -> T:
+        """ Returns the item with the lowest priority without removing it
+
+        Raise KeyError if the priority queue is empty
+
+        :return:
+        """
+        return self._first_live_bucket()[0][1]
+
+    def pop_n(self, n: int) -> List[T]:
+        output = list()
+        while self._counters and len(output) < n:
+            output.append(self.pop())
+        return output
+
+    def pop_all(self) -> List[T]:
+        return self.pop_n(len(self))
+
+    def _first_live_bucket(self) -> deque:
+        """ Moves the cursor to the lowest bucket with a live entry at its front and returns that bucket
+
+        Stale entries found on the way are dropped. When the bucket under the cursor is missing the cursor jumps
+        straight to the lowest remaining bucket, which is O(number of buckets) but doesn't scan every integer in
+        between sparse priorities.
+        """
+        if not self._counters:
+            raise KeyError('pop from an empty priority queue')
+        buckets, counters = self._buckets, self._counters
+        while True:
+            bucket = buckets.get(self._cursor)
+            if bucket is None:
+                self._cursor = min(buckets)
+                continue
+            while bucket:
+                access_counter, item = bucket[0]
+                if counters.get(item) == access_counter:
+                    return bucket
+                bucket.popleft()
+            del buckets[self._cursor]
@@ -0,0 +1,172 @@
+import threading
+from typing import Generic, List, Type
+
+from data_structures.queues.async_waiters import AsyncWaiters
+from data_structures.queues.priority_queue import MinHeap, Priority, PriorityInput, T
+
+
+class PopTimeout(KeyError):
+    """ Raised when a blocking pop times out, it is a KeyError like popping an empty MinHeap """
+    pass
+
+
+class ConcurrentPriorityQueue(Generic[T]):
+    """ Thread safe priority queue with blocking pops, built on MinHeap
+
+        Every operation runs under a single lock and pops wait on a condition variable that pushes notify, so
+        workers can block instead of polling. Pushing an item that is already queued updates its priority, as in
+        ''MinHeap.entry_handler''. ``pop_many`` takes several items per lock acquisition.
+    """
+
+    def __init__(self, heap_class: Type[MinHeap] = MinHeap) -> None:
+        """ Constructor
+
+        :param heap_class: MinHeap or any class sharing its interface, e.g. PriorityQueue for a max heap
+        """
+        self._heap = heap_class()
+        self._not_empty = threading.Condition(threading.Lock())
+
+    def __len__(self) -> int:
+        with self._not_empty:
+            return len(self._heap)
+
+    def push(self, item: T, priority: Priority = 0) -> None:
+        """ Pushes/updates an item into/in the priority queue and wakes up one waiting pop
+
+        :param item: What will be the added to the priority queue
+        :param priority: the item's priority
+        """
+        with self._not_empty:
+            self._heap.push(item, priority)
+            self._not_empty.notify()
+
+    def push_many(self, input_elements: PriorityInput) -> None:
+        """ Pushes/updates many items under a single lock acquisition
+
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
+        """
+        with self._not_empty:
+            self._heap.push_many(input_elements)
+            self._not_empty.notify(len(self._heap))
+
+    def pop(self, timeout: float = None) -> T:
+        """ Pops the item with the lowest priority, waiting for one if the queue is empty
+
+        Raise PopTimeout if the queue is still empty after timeout seconds
+
+        :param timeout: Seconds to wait, None waits forever and 0 doesn't wait
+        :return:
+        """
+        with self._not_empty:
+            self._wait_not_empty(timeout)
+            return self._heap.pop()
+
+    def pop_many(self, n: int, timeout: float = None) -> List[T]:
+        """ Pops up to n items under a single lock acquisition, waiting until there is at least one
+
+        Raise PopTimeout if the queue is still empty after timeout seconds
+
+        :param n: Maximum number of items to pop
+        :param timeout: Seconds to wait, None waits forever and 0 doesn't wait
+        :return: Returns a 'list()' object with the popped items
+        """
+        with self._not_empty:
+            self._wait_not_empty(timeout)
+            return self._heap.pop_n(n)
+
+    def peek(self) -> T:
+        with self._not_empty:
+            return self._heap.peek()
+
+    def remove_task(self, item: T) -> None:
+        with self._not_empty:
+            self._heap.remove_task(item)
+
+    def contains_item(self, item: T) -> bool:
+        with self._not_empty:
+            return self._heap.contains_item(item)
+
+    def _wait_not_empty(self, timeout: float) -> None:
+        """ Waits on the condition until the heap has items, must be called with the lock held """
+        if not self._not_empty.wait_for(lambda: len(self._heap) > 0, timeout):
+            raise PopTimeout('pop from an empty priority queue')
+
+
+class AsyncPriorityQueue(Generic[T]):
+    """ asyncio priority queue with awaitable pops, built on MinHeap
+
+        Pushes never block, so they are plain methods. Pops wait on futures that pushes resolve, like
+        ``asyncio.Queue``. Must only be used from the event loop thread.
+    """
+
+    def __init__(self, heap_class: Type[MinHeap] = MinHeap) -> None:
+        """ Constructor
+
+        :param heap_class: MinHeap or any class sharing its interface, e.g. PriorityQueue for a max heap
+        """
+        self._heap = heap_class()
+        self._getters = AsyncWaiters()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: T, priority: Priority = 0) -> None:
+        """ Pushes/updates an item into/in the priority queue and wakes up one waiting pop
+
+        :param item: What will be the added to the priority queue
+        :param priority: the item's priority
+        """
+        self._heap.push(item, priority)
+        self._wake_up_getter()
+
+    def push_many(self, input_elements: PriorityInput) -> None:
+        """ Pushes/updates many items at once
+
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
+        """
+        self._heap.push_many(input_elements)
+        self._wake_up_getter()
+
+    async def pop(self, timeout: float = None) -> T:
+        """ Pops the item with the lowest priority, waiting for one if the queue is empty
+
+        Raise PopTimeout if the queue is still empty after timeout seconds
+
+        :param timeout: Seconds to wait, None waits forever
+        :return:
+        """
+        await self._getters.wait_until(self._has_items, timeout, PopTimeout)
+        item = self._heap.pop()
+        self._wake_up_getter()
+        return item
+
+    async def pop_many(self, n: int, timeout: float = None) -> List[T]:
+        """ Pops up to n items, waiting until there is at least one
+
+        Raise PopTimeout if the queue is still empty after timeout seconds
+
+        :param n: Maximum number of items to pop
+        :param timeout: Seconds to wait, None waits forever
+        :return: Returns a 'list()' object with the popped items
+        """
+        await self._getters.wait_until(self._has_items, timeout, PopTimeout)
+        items = self._heap.pop_n(n)
+        self._wake_up_getter()
+        return items
+
+    def peek(self) -> T:
+        return self._heap.peek()
+
+    def remove_task(self, item: T) -> None:
+        self._heap.remove_task(item)
+
+    def contains_item(self, item: T) -> bool:
+        return self._heap.contains_item(item)
+
+    def _has_items(self) -> bool:
+        return len(self._heap) > 0
+
+    def _wake_up_getter(self) -> None:
+        """ Wakes up the oldest waiting pop, if there are items for it """
+        if self._heap:
+            self._getters.wake_up_next()
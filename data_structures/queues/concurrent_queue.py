@@ -0,0 +1,221 @@
+import threading
+from typing import Any, Iterable, List, Union
+
+from data_structures.queues.async_waiters import AsyncWaiters
+from data_structures.queues.queue import PopEmpty, Queue, QueueFull
+
+Batch = Union[List[Any], Any]  # A list, or an array.array in typed mode
+
+
+def _batch(values: Iterable[Any], capacity: int) -> List[Any]:
+    """ Materialises a batch to enqueue, raise ValueError if it can never fit in capacity """
+    values = list(values)
+    if capacity is not None and len(values) > capacity:
+        raise ValueError("Can't enqueue {0} values into a queue with capacity {1}".format(len(values), capacity))
+    return values
+
+
+class ConcurrentQueue(object):
+    """ Thread safe FIFO queue with blocking operations, built on Queue
+
+        Every operation runs under a single lock. Dequeues wait on a condition variable that enqueues notify, and
+        with a capacity enqueues wait on a second one that dequeues notify, which gives producers backpressure.
+        The batch methods move many items per lock acquisition. Timeouts raise the same exceptions as Queue,
+        PopEmpty for dequeues and QueueFull for enqueues.
+
+        Interface:
+            * enqueue/enqueue_many
+            * deque/deque_many
+            * is_empty
+    """
+
+    def __init__(self, capacity: int = None, typecode: str = None) -> None:
+        """ Constructor
+
+        :param capacity: Maximum number of items, None for unbounded
+        :param typecode: array.array typecode of the items, None stores any python object
+        """
+        self._queue = Queue(capacity, typecode)
+        self.capacity = capacity
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+
+    def __len__(self) -> int:
+        with self._not_empty:
+            return len(self._queue)
+
+    def is_empty(self):
+        return len(self) == 0
+
+    def enqueue(self, value: Any, timeout: float = None) -> None:
+        """ Adds a value at the end of the queue, waiting for room if it is at its capacity
+
+        Raise QueueFull if there is still no room after timeout seconds
+
+        :param value: Value to add
+        :param timeout: Seconds to wait, None waits forever and 0 doesn't wait
+        """
+        with self._not_full:
+            self._wait_for_room(1, timeout)
+            self._queue.enqueue(value)
+            self._not_empty.notify()
+
+    def enqueue_many(self, values: Iterable[Any], timeout: float = None) -> None:
+        """ Adds many values under a single lock acquisition, waiting until there is room for all of them
+
+        Raise ValueError if there are more values than the capacity
+        Raise QueueFull if there is still no room after timeout seconds, in which case none of them is added
+
+        :param values: Values to add, oldest first
+        :param timeout: Seconds to wait, None waits forever and 0 doesn't wait
+        """
+        values = _batch(values, self.capacity)
+        with self._not_full:
+            self._wait_for_room(len(values), timeout)
+            self._queue.enqueue_many(values)
+            self._not_empty.notify(len(values))
+
+    def deque(self, timeout: float = None) -> Any:
+        """ Removes the oldest value, waiting for one if the queue is empty
+
+        Raise PopEmpty if the queue is still empty after timeout seconds
+
+        :param timeout: Seconds to wait, None waits forever and 0 doesn't wait
+        :return: Returns the removed value
+        """
+        with self._not_empty:
+            self._wait_not_empty(timeout)
+            value = self._queue.deque()
+            self._notify_room()
+            return value
+
+    def deque_many(self, n: int, timeout: float = None) -> Batch:
+        """ Removes up to n of the oldest values under a single lock acquisition, waiting until there is at least one
+
+        Raise PopEmpty if the queue is still empty after timeout seconds
+
+        :param n: Maximum number of values to remove
+        :param timeout: Seconds to wait, None waits forever and 0 doesn't wait
+        :return: Returns the removed values oldest first, in an array.array of the queue's typecode in typed mode
+        """
+        with self._not_empty:
+            self._wait_not_empty(timeout)
+            values = self._queue.deque_many(n)
+            self._notify_room()
+            return values
+
+    def _wait_not_empty(self, timeout: float) -> None:
+        """ Waits until the queue has items, must be called with the lock held """
+        if not self._not_empty.wait_for(lambda: len(self._queue) > 0, timeout):
+            raise PopEmpty
+
+    def _wait_for_room(self, count: int, timeout: float) -> None:
+        """ Waits until count more items fit, must be called with the lock held """
+        if self.capacity is None:
+            return
+        if not self._not_full.wait_for(lambda: len(self._queue) + count <= self.capacity, timeout):
+            raise QueueFull
+
+    def _notify_room(self) -> None:
+        # Producers wait for room for batches of different sizes, waking a single one could pick one that still
+        # doesn't fit while another one would
+        if self.capacity is not None:
+            self._not_full.notify_all()
+
+
+class AsyncQueue(object):
+    """ asyncio FIFO queue with awaitable operations, built on Queue
+
+        Dequeues wait for items and, with a capacity, enqueues wait for room, both through AsyncWaiters.
+        Must only be used from the event loop thread.
+
+        Interface:
+            * enqueue/enqueue_many
+            * deque/deque_many
+            * is_empty
+    """
+
+    def __init__(self, capacity: int = None, typecode: str = None) -> None:
+        """ Constructor
+
+        :param capacity: Maximum number of items, None for unbounded
+        :param typecode: array.array typecode of the items, None stores any python object
+        """
+        self._queue = Queue(capacity, typecode)
+        self.capacity = capacity
+        self._getters = AsyncWaiters()
+        self._putters = AsyncWaiters()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def is_empty(self):
+        return self._queue.is_empty()
+
+    async def enqueue(self, value: Any, timeout: float = None) -> None:
+        """ Adds a value at the end of the queue, waiting for room if it is at its capacity
+
+        Raise QueueFull if there is still no room after timeout seconds
+
+        :param value: Value to add
+        :param timeout: Seconds to wait, None waits forever
+        """
+        await self._putters.wait_until(lambda: self._has_room(1), timeout, QueueFull)
+        self._queue.enqueue(value)
+        self._wake_up_getter()
+
+    async def enqueue_many(self, values: Iterable[Any], timeout: float = None) -> None:
+        """ Adds many values at once, waiting until there is room for all of them
+
+        Raise ValueError if there are more values than the capacity
+        Raise QueueFull if there is still no room after timeout seconds, in which case none of them is added
+
+        :param values: Values to add, oldest first
+        :param timeout: Seconds to wait, None waits forever
+        """
+        values = _batch(values, self.capacity)
+        await self._putters.wait_until(lambda: self._has_room(len(values)), timeout, QueueFull)
+        self._queue.enqueue_many(values)
+        self._wake_up_getter()
+
+    async def deque(self, timeout: float = None) -> Any:
+        """ Removes the oldest value, waiting for one if the queue is empty
+
+        Raise PopEmpty if the queue is still empty after timeout seconds
+
+        :param timeout: Seconds to wait, None waits forever
+        :return: Returns the removed value
+        """
+        await self._getters.wait_until(self._has_items, timeout, PopEmpty)
+        value = self._queue.deque()
+        self._wake_up_getter()
+        # Enqueues wait for room for batches of different sizes, so they all check again
+        self._putters.wake_up_all()
+        return value
+
+    async def deque_many(self, n: int, timeout: float = None) -> Batch:
+        """ Removes up to n of the oldest values, waiting until there is at least one
+
+        Raise PopEmpty if the queue is still empty after timeout seconds
+
+        :param n: Maximum number of values to remove
+        :param timeout: Seconds to wait, None waits forever
+        :return: Returns the removed values oldest first, in an array.array of the queue's typecode in typed mode
+        """
+        await self._getters.wait_until(self._has_items, timeout, PopEmpty)
+        values = self._queue.deque_many(n)
+        self._wake_up_getter()
+        self._putters.wake_up_all()
+        return values
+
+    def _has_items(self) -> bool:
+        return len(self._queue) > 0
+
+    def _has_room(self, count: int) -> bool:
+        return self.capacity is None or len(self._queue) + count <= self.capacity
+
+    def _wake_up_getter(self) -> None:
+        """ Wakes up the oldest waiting dequeue, if there are items for it """
+        if self._queue:
+            self._getters.wake_up_next()
@@ -1,48 +1,50 @@
 import heapq
-from collections import Sequence
 from itertools import count
-from typing import List, Any, Dict, TypeVar, Generic, Union, Tuple, Generator
+from typing import List, Any, Dict, TypeVar, Generic, Union, Tuple, Iterable, Mapping
 
 T = TypeVar("T")
 Priority = Union[int, float]
-EntryAttributeType = Union[Priority, Dict, T]
+PriorityInput = Union[Iterable[Tuple[T, Priority]], Mapping[T, Priority]]
 
 
 # TODO: Update Docs for Min Heap, because its original name was priority queue
 
 
-class Entry(Sequence, Generic[T]):
+def _priority_pairs(input_elements: PriorityInput) -> Iterable[Tuple[T, Priority]]:
+    """ Normalizes the inputs of the bulk operations into (item, priority) pairs """
+    if isinstance(input_elements, Mapping):
+        return input_elements.items()
+    return input_elements
+
+
+class Entry(list):
     """ Helper class to handle a entry in the MinHeap/priority queue
 
-        This class inherits from the Sequence container, so it behaves like a Sequence when getting its attributes
-        This is purely a personal preference
+        An entry is a ``[priority, access_counter, item]`` list, so heapq compares entries with the C list
+        comparison without allocating anything, and ``__slots__`` keeps instances as small as a plain list.
+        The named properties are only used outside the hot path.
     """
 
-    def __init__(self, priority: Priority, access_counter: Dict, item: T) -> None:
-        self.priority, self.access_counter, self.item = priority, access_counter, item
-
-    # noinspection PyTypeChecker
-    # Doesn't  handle a generator correctly yet
-    def __iter__(self) -> Generator[EntryAttributeType, None, None]:
-        yield self.priority
-        yield self.access_counter
-        yield self.item
-
-    def __getitem__(self, key: int) -> EntryAttributeType:
-        if key == 0:
-            return self.priority
-        if key == 1:
-            return self.access_counter
-        if key == 2:
-            return self.item
-        else:
-            raise IndexError()
+    __slots__ = ()
 
-    def __len__(self) -> int:
-        return 3
+    def __init__(self, priority: Priority, access_counter: int, item: T) -> None:
+        super(Entry, self).__init__((priority, access_counter, item))
+
+    @property
+    def priority(self) -> Priority:
+        return self[0]
+
+    @property
+    def access_counter(self) -> int:
+        return self[1]
 
-    def __lt__(self, other):
-        return (self.priority, self.access_counter, self.item) < (other.priority, other.access_counter, other.item)
+    @property
+    def item(self) -> T:
+        return self[2]
+
+    @item.setter
+    def item(self, item: T) -> None:
+        self[2] = item
 
 
 class MinHeap(Generic[T]):
@@ -50,15 +52,29 @@ class MinHeap(Generic[T]):
 
         Has the functionality to push, pop, heapify update and pop_all from heap
         To build a a new object from a queue use the ''@classmethod PriorityQueue.build()''
+
+        Updated and removed items leave REMOVED entries behind in the heap. Once there are more than
+        ``compaction_threshold`` stale entries per live one, the heap is rebuilt with only the live entries,
+        so its memory stays proportional to ``len(self)``.
     """
 
     REMOVED = '<removed-task>'  # placeholder for a removed task
     PRIORITY_CONSTANT = 1  # Means that priorities are positive and that this is a min heap
+    COMPACTION_THRESHOLD = 1.0  # Stale entries allowed per live entry before compacting
+    COMPACTION_MIN_SIZE = 64  # Small heaps are never compacted, it isn't worth it
+    HEAPIFY_RATIO = 8  # push_many heapifies when the batch is at least 1/8 of the heap
 
-    def __init__(self):
+    def __init__(self, compaction_threshold: float = None):
+        """ Constructor
+
+        :param compaction_threshold: Ratio of stale to live entries that triggers a compaction
+        """
         self._access_counter = count()
-        self._queue = list()  # type: List[T]
-        self.entry_finder = dict()  # type: Dict[T]
+        self._queue = list()  # type: List[Entry]
+        self.entry_finder = dict()  # type: Dict[T, Entry]
+        self._stale = 0  # Number of REMOVED entries still in _queue
+        self.compaction_threshold = self.COMPACTION_THRESHOLD if compaction_threshold is None \
+            else compaction_threshold
 
     def __len__(self):
         return len(self.entry_finder)
@@ -74,6 +90,24 @@ class MinHeap(Generic[T]):
         entry = self.entry_handler(item, priority)
         # Add to heap
         heapq.heappush(self._queue, entry)
+        self._maybe_compact()
+
+    def push_many(self, input_elements: PriorityInput) -> None:
+        """ Pushes/updates many items at once
+
+        Pushing k items one by one costs O(k log(n + k)) while heapifying everything costs O(n + k), so the whole
+        heap is re-heapified when the batch is at least ``1 / HEAPIFY_RATIO`` of the heap size.
+
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
+        """
+        entries = [self.entry_handler(item, priority) for item, priority in _priority_pairs(input_elements)]
+        if len(entries) * self.HEAPIFY_RATIO >= len(self._queue):
+            self._queue.extend(entries)
+            heapq.heapify(self._queue)
+        else:
+            for entry in entries:
+                heapq.heappush(self._queue, entry)
+        self._maybe_compact()
 
     def entry_handler(self, item: Any, priority: Priority = 0) -> Entry:
         """ Creates the entry that will be stored on the heap
@@ -99,7 +133,7 @@ class MinHeap(Generic[T]):
         """
         # Remove item from entry finder if it is there and mark the entry with the ''REMOVED'' flag
         if item in self.entry_finder:
-            self.remove_task(item)
+            self._mark_removed(item)
         # Update access counter
         access_counter = next(self._access_counter)
         # Add item to entry_finder and heap
@@ -109,25 +143,22 @@ class MinHeap(Generic[T]):
         self.entry_finder[item] = entry
         return entry
 
-    def heapify(self, input_elements: List[Tuple[T, Priority]]):
+    def heapify(self, input_elements: PriorityInput) -> None:
         """ Implements a heapify functionality for the priority queue
 
         The reason why ``heapq.heapify`` can't be performed directly in input_elements is that we need to create and
-        handle a new entry for every element in the input list
+        handle a new entry for every element in the input list. Items can be of any hashable type.
 
 
         .. seealso:: ''PriorityQueue.entry_handler''
-        .. TODO:: Add support for Any type items instead of just int (right now they have to be the indexes)
 
-        :param input_elements: List of either int of float priorities.
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
         :return:
         """
-        entry_list = list()
-        for item in input_elements:
-            i, priority = item
-            entry_list.append(self.entry_handler(i, priority=priority))
-        heapq.heapify(entry_list)
-        self._queue = entry_list
+        for item, priority in _priority_pairs(input_elements):
+            self._queue.append(self.entry_handler(item, priority=priority))
+        heapq.heapify(self._queue)
+        self._maybe_compact()
 
     def remove_task(self, item: T) -> None:
         """ Mark an existing task as REMOVED.
@@ -136,8 +167,26 @@ class MinHeap(Generic[T]):
 
         :param item: Item to remove
         """
+        self._mark_removed(item)
+        self._maybe_compact()
+
+    def _mark_removed(self, item: T) -> None:
+        """ Flags the entry of item as REMOVED without compacting, so entries being built can't be lost """
         entry = self.entry_finder.pop(item)
-        entry.item = self.REMOVED
+        entry[2] = self.REMOVED
+        self._stale += 1
+
+    def _maybe_compact(self) -> None:
+        """ Rebuilds the heap without its REMOVED entries once they outnumber the live ones by the threshold """
+        stale = self._stale
+        if stale > self.COMPACTION_MIN_SIZE and stale > self.compaction_threshold * len(self.entry_finder):
+            self.compact()
+
+    def compact(self) -> None:
+        """ Drops every REMOVED entry and heapifies what is left, O(n) """
+        self._queue = list(self.entry_finder.values())
+        heapq.heapify(self._queue)
+        self._stale = 0
 
     def pop(self) -> T:
         """ Pops an item from the priority queue
@@ -148,17 +197,74 @@ class MinHeap(Generic[T]):
         :return:
         """
         while self._queue:
-            priority, access_counter, item = heapq.heappop(self._queue)
+            item = heapq.heappop(self._queue)[2]
             if item is not self.REMOVED:
                 del self.entry_finder[item]
                 return item
+            self._stale -= 1
         raise KeyError('pop from an empty priority queue')
 
+    def peek(self) -> T:
+        """ Returns the item with the lowest priority without removing it
+
+        Raise KeyError if the priority queue is empty
+
+        :return:
+        """
+        while self._queue:
+            if self._queue[0][2] is not self.REMOVED:
+                return self._queue[0][2]
+            heapq.heappop(self._queue)  # Drop the removed entries that reached the top
+            self._stale -= 1
+        raise KeyError('peek from an empty priority queue')
+
+    def pop_n(self, n: int) -> List[T]:
+        """ Pops up to n items, in priority order
+
+        :param n: Maximum number of items to pop
+        :return: Returns a 'list()' object with the popped items
+        """
+        output = list()
+        while self.entry_finder and len(output) < n:
+            output.append(self.pop())
+        return output
+
+    def peek_n(self, n: int) -> List[T]:
+        """ Returns up to n items in priority order without removing them
+
+        The heap is walked best first from the root with a small side heap of candidate positions, so this is
+        O(n log(n)) whatever the size of the priority queue.
+
+        :param n: Maximum number of items to return
+        :return: Returns a 'list()' object with the items
+        """
+        queue = self._queue
+        output = list()
+        candidates = [(queue[0], 0)] if queue else []
+        while candidates and len(output) < n:
+            entry, position = heapq.heappop(candidates)
+            if entry[2] is not self.REMOVED:
+                output.append(entry[2])
+            for child_position in (2 * position + 1, 2 * position + 2):
+                if child_position < len(queue):
+                    heapq.heappush(candidates, (queue[child_position], child_position))
+        return output
+
+    def merge(self, other: 'MinHeap') -> None:
+        """ Pushes every item of other into this priority queue, other is left untouched
+
+        Items that are in both take the priority they have in other. entry_finder is ordered by access counter,
+        so items with equal priorities keep the order they had in other.
+
+        :param other: Priority queue to merge in
+        """
+        self.push_many([(entry[2], other.PRIORITY_CONSTANT * entry[0]) for entry in other.entry_finder.values()])
+
     @classmethod
-    def build(cls, input_elements: List[Tuple[T, Priority]]) -> 'MinHeap':
+    def build(cls, input_elements: PriorityInput) -> 'MinHeap':
         """ Builds the priority queue from an input by calling heapify
 
-        :param input_elements:
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
         :return: Returns the new PriorityQueue object
         """
 
@@ -172,7 +278,7 @@ class MinHeap(Generic[T]):
         :return: Returns a 'list()' object with all the elements
         """
         output = list()
-        while self._queue:
+        while self.entry_finder:
             output.append(self.pop())
         return output
 
@@ -180,6 +286,464 @@ class MinHeap(Generic[T]):
         return item in self.entry_finder
 
 
+class IndexedMinHeap(Generic[T]):
+    """ Implements a min heap with true decrease-key, sharing the interface of MinHeap
+
+        The heap is a list of ``(priority, access_counter, item)`` tuples and ''_positions'' maps every item to its
+        index in that list. Changing the priority of an item overwrites its entry and sifts it up or down in place,
+        and removing an item swaps the last entry into its slot, so no REMOVED placeholders are ever left behind:
+        the heap always holds exactly ``len(self)`` entries.
+
+        The access counter keeps equal priorities in the order they were last pushed, like MinHeap.
+    """
+
+    PRIORITY_CONSTANT = 1  # Means that priorities are positive and that this is a min heap
+    HEAPIFY_RATIO = 8  # push_many rebuilds the heap when the batch is at least 1/8 of the heap
+
+    def __init__(self):
+        self._access_counter = count()
+        self._queue = list()  # type: List[Tuple[Priority, int, T]]
+        self._positions = dict()  # type: Dict[T, int]
+
+    def __len__(self):
+        return len(self._queue)
+
+    def push(self, item: T, priority: Priority = 0) -> None:
+        """ Pushes/updates an item into/in the priority queue in O(log(n))
+
+        :param item: What will be the added to the priority queue
+        :param priority: the item's priority
+        """
+        entry = (self.PRIORITY_CONSTANT * priority, next(self._access_counter), item)
+        position = self._positions.get(item)
+        if position is None:
+            self._queue.append(entry)
+            self._sift_up(len(self._queue) - 1)
+        else:
+            old_entry = self._queue[position]
+            self._queue[position] = entry
+            self._restore(position, entry < old_entry)
+
+    def push_many(self, input_elements: PriorityInput) -> None:
+        """ Pushes/updates many items at once
+
+        New items are appended and the whole heap is rebuilt in O(n) when they are at least
+        ``1 / HEAPIFY_RATIO`` of the heap size, otherwise they are pushed one by one.
+
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
+        """
+        pending = dict()  # type: Dict[T, Tuple[Priority, int, T]]
+        for item, priority in _priority_pairs(input_elements):
+            if item in self._positions:
+                self.push(item, priority)
+            else:
+                # A duplicate inside the batch just replaces the pending entry
+                pending[item] = (self.PRIORITY_CONSTANT * priority, next(self._access_counter), item)
+
+        new_entries = list(pending.values())
+        if len(new_entries) * self.HEAPIFY_RATIO >= len(self._queue):
+            self._queue.extend(new_entries)
+            self._rebuild()
+        else:
+            for entry in new_entries:
+                self._queue.append(entry)
+                self._sift_up(len(self._queue) - 1)
+
+    def heapify(self, input_elements: PriorityInput) -> None:
+        """ Pushes every (item, priority) pair, in O(n) when the heap is empty
+
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
+        """
+        self.push_many(input_elements)
+
+    def remove_task(self, item: T) -> None:
+        """ Removes an item from the heap in O(log(n))
+
+        Raise KeyError if not found.
+
+        :param item: Item to remove
+        """
+        position = self._positions.pop(item)
+        removed_entry = self._queue[position]
+        last_entry = self._queue.pop()
+        if position < len(self._queue):
+            self._queue[position] = last_entry
+            self._restore(position, last_entry < removed_entry)
+
+    def pop(self) -> T:
+        """ Pops the item with the lowest priority
+
+        Raise KeyError if the priority queue is empty
+
+        :return:
+        """
+        if not self._queue:
+            raise KeyError('pop from an empty priority queue')
+        last_entry = self._queue.pop()
+        if self._queue:
+            top_entry = self._queue[0]
+            self._queue[0] = last_entry
+            self._sift_down(0)
+        else:
+            top_entry = last_entry
+        del self._positions[top_entry[2]]
+        return top_entry[2]
+
+    def peek(self) -> T:
+        """ Returns the item with the lowest priority without removing it
+
+        Raise KeyError if the priority queue is empty
+
+        :return:
+        """
+        if not self._queue:
+            raise KeyError('peek from an empty priority queue')
+        return self._queue[0][2]
+
+    @classmethod
+    def build(cls, input_elements: List[Tuple[T, Priority]]) -> 'IndexedMinHeap':
+        """ Builds the priority queue from an input by calling heapify
+
+        :param input_elements:
+        :return: Returns the new IndexedMinHeap object
+        """
+        new_queue = cls()
+        new_queue.heapify(input_elements)
+        return new_queue
+
+    def pop_n(self, n: int) -> List[T]:
+        """ Pops up to n items, in priority order
+
+        :param n: Maximum number of items to pop
+        :return: Returns a 'list()' object with the popped items
+        """
+        output = list()
+        while self._queue and len(output) < n:
+            output.append(self.pop())
+        return output
+
+    def pop_all(self) -> List[T]:
+        """ Pops all elements from queue
+
+        :return: Returns a 'list()' object with all the elements
+        """
+        return self.pop_n(len(self._queue))
+
+    def contains_item(self, item: T) -> bool:
+        return item in self._positions
+
+    def _rebuild(self) -> None:
+        """ Restores the heap property of the whole list in O(n) and recomputes every position """
+        heapq.heapify(self._queue)
+        self._positions = {entry[2]: position for position, entry in enumerate(self._queue)}
+
+    def _restore(self, position: int, moved_up: bool) -> None:
+        """ Restores the heap property after the entry at position changed """
+        if moved_up:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def _sift_up(self, position: int) -> None:
+        queue, positions = self._queue, self._positions
+        entry = queue[position]
+        while position > 0:
+            parent_position = (position - 1) >> 1
+            parent_entry = queue[parent_position]
+            if not entry < parent_entry:
+                break
+            queue[position] = parent_entry
+            positions[parent_entry[2]] = position
+            position = parent_position
+        queue[position] = entry
+        positions[entry[2]] = position
+
+    def _sift_down(self, position: int) -> None:
+        queue, positions = self._queue, self._positions
+        size = len(queue)
+        entry = queue[position]
+        while True:
+            child_position = 2 * position + 1
+            if child_position >= size:
+                break
+            right_position = child_position + 1
+            if right_position < size and queue[right_position] < queue[child_position]:
+                child_position = right_position
+            child_entry = queue[child_position]
+            if not child_entry < entry:
+                break
+            queue[position] = child_entry
+            positions[child_entry[2]] = position
+            position = child_position
+        queue[position] = entry
+        positions[entry[2]] = position
+
+
+class DaryHeap(IndexedMinHeap):
+    """ Implements an indexed d-ary min heap, 4-ary by default
+
+        Every node has ARITY children, so the tree is log2(ARITY) times shallower than a binary heap. Pushes and
+        decrease-keys sift up through fewer levels and pops scan each group of siblings in one contiguous run of
+        the list, which suits decrease-key heavy workloads like Dijkstra.
+        Shares the interface of IndexedMinHeap and MinHeap.
+    """
+
+    ARITY = 4
+
+    def _rebuild(self) -> None:
+        """ Bottom up heap construction, O(n) for any arity """
+        self._positions = {entry[2]: position for position, entry in enumerate(self._queue)}
+        for position in range((len(self._queue) - 2) // self.ARITY, -1, -1):
+            self._sift_down(position)
+
+    def _sift_up(self, position: int) -> None:
+        queue, positions, arity = self._queue, self._positions, self.ARITY
+        entry = queue[position]
+        while position > 0:
+            parent_position = (position - 1) // arity
+            parent_entry = queue[parent_position]
+            if not entry < parent_entry:
+                break
+            queue[position] = parent_entry
+            positions[parent_entry[2]] = position
+            position = parent_position
+        queue[position] = entry
+        positions[entry[2]] = position
+
+    def _sift_down(self, position: int) -> None:
+        queue, positions, arity = self._queue, self._positions, self.ARITY
+        size = len(queue)
+        entry = queue[position]
+        while True:
+            first_child = arity * position + 1
+            if first_child >= size:
+                break
+            child_position = first_child
+            child_entry = queue[first_child]
+            for sibling_position in range(first_child + 1, min(first_child + arity, size)):
+                if queue[sibling_position] < child_entry:
+                    child_position, child_entry = sibling_position, queue[sibling_position]
+            if not child_entry < entry:
+                break
+            queue[position] = child_entry
+            positions[child_entry[2]] = position
+            position = child_position
+        queue[position] = entry
+        positions[entry[2]] = position
+
+
+class _PairingNode(object):
+    """ Node of a PairingHeap, in leftmost child / right sibling form
+
+        ``previous`` is the parent for a leftmost child and the left sibling otherwise, so a node can be cut out of
+        the tree in O(1)
+    """
+
+    __slots__ = ('key', 'item', 'child', 'sibling', 'previous')
+
+    def __init__(self, key: Tuple[Priority, int], item: T) -> None:
+        self.key = key
+        self.item = item
+        self.child = self.sibling = self.previous = None
+
+
+class PairingHeap(Generic[T]):
+    """ Implements a pairing heap with an item -> node map, sharing the interface of MinHeap
+
+        Pushes and decrease-keys meld a single node into the root in O(1), pops merge the children of the root
+        with the two pass pairing method in O(log(n)) amortized. This makes it the fastest option when keys are
+        decreased much more often than items are popped.
+
+        The access counter keeps equal priorities in the order they were last pushed, like MinHeap.
+    """
+
+    PRIORITY_CONSTANT = 1  # Means that priorities are positive and that this is a min heap
+
+    def __init__(self) -> None:
+        self._access_counter = count()
+        self._root = None  # type: _PairingNode
+        self._nodes = dict()  # type: Dict[T, _PairingNode]
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def push(self, item: T, priority: Priority = 0) -> None:
+        """ Pushes/updates an item into/in the priority queue
+
+        Decreasing the priority of an item cuts its subtree and melds it back into the root, O(1). Increasing it
+        removes and reinserts the item, O(log(n)) amortized.
+
+        :param item: What will be the added to the priority queue
+        :param priority: the item's priority
+        """
+        key = (self.PRIORITY_CONSTANT * priority, next(self._access_counter))
+        node = self._nodes.get(item)
+        if node is not None and key < node.key:
+            node.key = key
+            if node is not self._root:
+                self._cut(node)
+                self._root = self._link(self._root, node)
+            return
+        if node is not None:
+            self.remove_task(item)
+        node = self._nodes[item] = _PairingNode(key, item)
+        self._root = node if self._root is None else self._link(self._root, node)
+
+    def push_many(self, input_elements: PriorityInput) -> None:
+        """ Pushes/updates many items, every push is already O(1)
+
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
+        """
+        for item, priority in _priority_pairs(input_elements):
+            self.push(item, priority)
+
+    def heapify(self, input_elements: PriorityInput) -> None:
+        self.push_many(input_elements)
+
+    @classmethod
+    def build(cls, input_elements: PriorityInput) -> 'PairingHeap':
+        """ Builds the priority queue from (item, priority) pairs
+
+        :param input_elements:
+        :return: Returns the new PairingHeap object
+        """
+        new_queue = cls()
+        new_queue.push_many(input_elements)
+        return new_queue
+
+    def remove_task(self, item: T) -> None:
+        """ Removes an item from the heap in O(log(n)) amortized
+
+        Raise KeyError if not found.
+
+        :param item: Item to remove
+        """
+        node = self._nodes.pop(item)
+        if node is self._root:
+            self._root = self._merge_pairs(node.child)
+            return
+        self._cut(node)
+        subtree = self._merge_pairs(node.child)
+        if subtree is not None:
+            self._root = self._link(self._root, subtree)
+
+    def pop(self) -> T:
+        """ Pops the item with the lowest priority
+
+        Raise KeyError if the priority queue is empty
+
+        :return:
+        """
+        root = self._root
+        if root is None:
+            raise KeyError('pop from an empty priority queue')
+        del self._nodes[root.item]
+        self._root = self._merge_pairs(root.child)
+        return root.item
+
+    def peek(self) -> T:
+        if self._root is None:
+            raise KeyError('peek from an empty priority queue')
+        return self._root.item
+
+    def pop_n(self, n: int) -> List[T]:
+        output = list()
+        while self._root is not None and len(output) < n:
+            output.append(self.pop())
+        return output
+
+    def pop_all(self) -> List[T]:
+        return self.pop_n(len(self))
+
+    def contains_item(self, item: T) -> bool:
+        return item in self._nodes
+
+    @staticmethod
+    def _link(first: _PairingNode, second: _PairingNode) -> _PairingNode:
+        """ Melds two detached trees, the root with the larger key becomes the leftmost child of the other """
+        if second.key < first.key:
+            first, second = second, first
+        second.previous = first
+        second.sibling = first.child
+        if first.child is not None:
+            first.child.previous = second
+        first.child = second
+        return first
+
+    @staticmethod
+    def _cut(node: _PairingNode) -> None:
+        """ Detaches the subtree of a non root node from its parent and siblings """
+        previous = node.previous
+        if previous.child is node:
+            previous.child = node.sibling
+        else:
+            previous.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.previous = previous
+        node.sibling = node.previous = None
+
+    @classmethod
+    def _merge_pairs(cls, first: _PairingNode) -> _PairingNode:
+        """ Two pass pairing: link the siblings left to right in pairs, then meld the pairs right to left
+
+        Iterative, so long sibling lists can't hit the recursion limit
+
+        :param first: Leftmost node of a sibling list
+        :return: Returns the root of the merged tree, None for an empty list
+        """
+        pairs = list()  # type: List[_PairingNode]
+        node = first
+        while node is not None:
+            second = node.sibling
+            next_node = second.sibling if second is not None else None
+            node.sibling = node.previous = None
+            if second is None:
+                pairs.append(node)
+            else:
+                second.sibling = second.previous = None
+                pairs.append(cls._link(node, second))
+            node = next_node
+
+        root = pairs.pop() if pairs else None
+        while pairs:
+            root = cls._link(pairs.pop(), root)
+        return root
+
+
+HEAP_STRATEGIES = {
+    'binary': MinHeap,
+    'indexed': IndexedMinHeap,
+    'dary': DaryHeap,
+    'pairing': PairingHeap,
+}  # type: Dict[str, type]
+
+_max_heap_classes = dict()  # type: Dict[str, type]
+
+
+def get_heap_class(strategy: str = 'binary', max_heap: bool = False) -> type:
+    """ Returns the priority queue class implementing a heap strategy
+
+    Every strategy shares the push/pop/peek/remove_task/contains_item interface, so the result can be passed as
+    ``queue_class`` to the graph algorithms or as ``heap_class`` to the concurrent priority queues.
+    Max heaps are subclasses with ``PRIORITY_CONSTANT = -1``, like PriorityQueue.
+
+    :param strategy: One of 'binary', 'indexed', 'dary' or 'pairing'
+    :param max_heap: Pop the highest priority first
+    :return: Returns the class
+    """
+    if strategy not in HEAP_STRATEGIES:
+        raise ValueError("Unknown heap strategy {0}".format(strategy))
+    if not max_heap:
+        return HEAP_STRATEGIES[strategy]
+    if strategy == 'binary':
+        return PriorityQueue
+    if strategy not in _max_heap_classes:
+        min_heap_class = HEAP_STRATEGIES[strategy]
+        _max_heap_classes[strategy] = type('Max' + min_heap_class.__name__, (min_heap_class,),
+                                           {'PRIORITY_CONSTANT': -1})
+    return _max_heap_classes[strategy]
+
+
 class PriorityQueue(MinHeap):
     """ Implements a priority queue using heapq (min heap)
 
@@ -1,38 +1,142 @@
-from typing import Any
-from data_structures.linked_lists.linked_list import Node
+from array import array
+from typing import Any, Iterable, List, Sequence, Union
 
 
 class PopEmpty(Exception):
     pass
 
 
+class QueueFull(Exception):
+    pass
+
+
 class Queue(object):
-    def __init__(self):
-        self._head = self._tail = None
+    """ FIFO queue stored in a circular buffer
+
+        Items live in one contiguous buffer whose size is a power of two, ``_head`` indexes the oldest item and the
+        newest one sits ``_length - 1`` slots after it, wrapping around the end. When the buffer fills up it doubles,
+        so enqueue and deque are O(1) amortised and no object is allocated per item. With a capacity the queue
+        never holds more than that many items and enqueueing into a full queue raises QueueFull. The buffer still
+        starts small and grows on demand, up to the first power of two that fits the capacity.
+
+        With a typecode the buffer is an ``array.array`` of that type, which stores numbers unboxed.
+
+        Interface:
+            * enqueue/enqueue_many
+            * deque/deque_many
+            * is_empty
+    """
+
+    INITIAL_SIZE = 8
+
+    def __init__(self, capacity: int = None, typecode: str = None) -> None:
+        """ Constructor
+
+        :param capacity: Maximum number of items, None for unbounded
+        :param typecode: array.array typecode of the items, None stores any python object
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.typecode = typecode
+        self._buffer = self._new_buffer(self.INITIAL_SIZE)
+        self._head = 0
         self._length = 0
 
+    def _new_buffer(self, size: int) -> Union[List[Any], array]:
+        if self.typecode is None:
+            return [None] * size
+        return array(self.typecode, [0]) * size
+
+    def _reserve(self, count: int) -> None:
+        """ Makes room for count more items, growing the buffer if needed
+
+        Raise QueueFull if the queue has a capacity and it can't take count more items
+        """
+        needed = self._length + count
+        if self.capacity is not None and needed > self.capacity:
+            raise QueueFull
+        size = len(self._buffer)
+        if needed <= size:
+            return
+        while size < needed:
+            size *= 2
+        buffer = self._new_buffer(size)
+        buffer[:self._length] = self._ordered(self._length)
+        self._buffer = buffer
+        self._head = 0
+
+    def _ordered(self, count: int) -> Sequence[Any]:
+        """ Copies the count oldest items in FIFO order """
+        buffer, head = self._buffer, self._head
+        end = head + count
+        if end <= len(buffer):
+            return buffer[head:end]
+        return buffer[head:] + buffer[:end - len(buffer)]
+
     def enqueue(self, value: Any) -> None:
-        new_node = Node(value)
-        if not self._tail:
-            self._tail = new_node
-        if self._head:
-            self._head.next = new_node
+        """ Adds a value at the end of the queue
+
+        Raise QueueFull if the queue is at its capacity
 
-        self._head = new_node
+        :param value: Value to add
+        """
+        if self._length == len(self._buffer) or self._length == self.capacity:
+            self._reserve(1)
+        buffer = self._buffer
+        buffer[(self._head + self._length) & (len(buffer) - 1)] = value
         self._length += 1
 
+    def enqueue_many(self, values: Iterable[Any]) -> None:
+        """ Adds many values at the end of the queue, copying them in at most two slices
+
+        Raise QueueFull if they don't all fit, in which case none of them is added
+
+        :param values: Values to add, oldest first
+        """
+        values = list(values) if self.typecode is None else array(self.typecode, values)
+        count = len(values)
+        self._reserve(count)
+        buffer = self._buffer
+        tail = (self._head + self._length) & (len(buffer) - 1)
+        first = min(count, len(buffer) - tail)
+        buffer[tail:tail + first] = values[:first]
+        buffer[:count - first] = values[first:]
+        self._length += count
+
     def deque(self) -> Any:
-        if not self._tail:
+        """ Removes the oldest value of the queue
+
+        Raise PopEmpty if the queue is empty
+
+        :return: Returns the removed value
+        """
+        if not self._length:
             raise PopEmpty
-        value = self._tail.value
+        buffer, head = self._buffer, self._head
+        value = buffer[head]
+        if self.typecode is None:
+            buffer[head] = None  # Don't keep the value alive
+        self._head = (head + 1) & (len(buffer) - 1)
         self._length -= 1
+        return value
 
-        if self._head == self._tail:
-            self._head = self._tail = self._tail.next
-        else:
-            self._tail = self._tail.next
+    def deque_many(self, n: int) -> Union[List[Any], array]:
+        """ Removes up to n of the oldest values of the queue
 
-        return value
+        :param n: Maximum number of values to remove, nothing is removed when it isn't positive
+        :return: Returns the removed values oldest first, in an array.array of the queue's typecode in typed mode
+        """
+        count = max(0, min(n, self._length))
+        values = self._ordered(count)
+        if self.typecode is None:
+            buffer, head = self._buffer, self._head
+            end = min(head + count, len(buffer))
+            buffer[head:end] = [None] * (end - head)
+            buffer[:count - (end - head)] = [None] * (count - (end - head))
+        self._head = (self._head + count) & (len(self._buffer) - 1)
+        self._length -= count
+        return values
 
     def is_empty(self):
         return True if self._length == 0 else False
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from typing import Callable, List
+from unittest import TestCase
+
+
+class AsyncTestCase(TestCase):
+    """ TestCase that runs every coroutine on a fresh event loop """
+
+    def run_coroutine(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+
+def produce_and_consume(put: Callable[[int], None], take_many: Callable[[], List[int]], empty_error: type,
+                        number_of_threads: int = 4, items_per_producer: int = 1000) -> List[int]:
+    """ Runs producer threads putting disjoint ranges of ints against consumer threads taking batches
+
+    Consumers stop once the producers are done and take_many raises empty_error
+
+    :param put: Puts one int into the queue under test
+    :param take_many: Takes a batch from the queue, raising empty_error after a short timeout
+    :param empty_error: Exception take_many raises when the queue stays empty
+    :param number_of_threads: Number of producers, and of consumers
+    :param items_per_producer: Number of ints every producer puts
+    :return: Returns every consumed int, in no particular order
+    """
+    producers_done = threading.Event()
+    consumed = []
+    consumed_lock = threading.Lock()
+
+    def consume():
+        while True:
+            try:
+                items = take_many()
+            except empty_error:
+                if producers_done.is_set():
+                    return
+                continue
+            with consumed_lock:
+                consumed.extend(items)
+
+    def produce(start):
+        for item in range(start, start + items_per_producer):
+            put(item)
+
+    consumers = [threading.Thread(target=consume) for _ in range(number_of_threads)]
+    producers = [threading.Thread(target=produce, args=(start,))
+                 for start in range(0, number_of_threads * items_per_producer, items_per_producer)]
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    producers_done.set()
+    for thread in consumers:
+        thread.join()
+    return consumed
@@ -0,0 +1,48 @@
+import random
+from unittest import TestCase
+
+from data_structures.queues.bucket_queue import BucketQueue
+from data_structures.queues.priority_queue import MinHeap
+
+
+class TestBucketQueue(TestCase):
+    def test_push_pop(self):
+        queue = BucketQueue.build([("a", 3), ("b", 1), ("c", 3), ("d", 0.0)])
+        assert queue.peek() == "d"
+        assert queue.pop_all() == ["d", "b", "a", "c"]
+        with self.assertRaises(KeyError):
+            queue.pop()
+
+    def test_update_and_remove(self):
+        queue = BucketQueue.build({"a": 5, "b": 4, "c": 6})
+        queue.push("a", 2)
+        queue.remove_task("b")
+        assert len(queue) == 2
+        assert not queue.contains_item("b")
+        assert queue.pop_all() == ["a", "c"]
+
+    def test_push_below_cursor(self):
+        queue = BucketQueue.build({"a": 5, "b": 9})
+        assert queue.pop() == "a"
+        queue.push("c", 1)
+        assert queue.pop_all() == ["c", "b"]
+
+    def test_invalid_priorities(self):
+        queue = BucketQueue()
+        with self.assertRaises(ValueError):
+            queue.push("a", 1.5)
+        with self.assertRaises(ValueError):
+            queue.push("a", -1)
+
+    def test_matches_min_heap(self):
+        rng = random.Random(5)
+        bucket_queue, reference = BucketQueue(), MinHeap()
+        for _ in range(2000):
+            item = rng.randrange(40)
+            if rng.random() < 0.6:
+                priority = rng.randrange(30)
+                bucket_queue.push(item, priority)
+                reference.push(item, priority)
+            elif reference:
+                assert bucket_queue.pop() == reference.pop()
+        assert bucket_queue.pop_all() == reference.pop_all()
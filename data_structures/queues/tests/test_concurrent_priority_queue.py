@@ -0,0 +1,73 @@
+import asyncio
+from unittest import TestCase
+
+from data_structures.queues.concurrent_priority_queue import ConcurrentPriorityQueue, AsyncPriorityQueue, \
+    PopTimeout
+from data_structures.queues.priority_queue import PriorityQueue
+from data_structures.queues.tests.concurrency import AsyncTestCase, produce_and_consume
+
+
+class TestConcurrentPriorityQueue(TestCase):
+    def test_priority_order_and_updates(self):
+        queue = ConcurrentPriorityQueue()
+        queue.push_many([("a", 3), ("b", 1), ("c", 2)])
+        queue.push("a", 0)
+        assert len(queue) == 3
+        assert queue.pop() == "a"
+        assert queue.pop_many(5) == ["b", "c"]
+
+    def test_max_heap(self):
+        queue = ConcurrentPriorityQueue(PriorityQueue)
+        queue.push_many([("a", 3), ("b", 1)])
+        assert queue.pop() == "a"
+
+    def test_timeout(self):
+        queue = ConcurrentPriorityQueue()
+        with self.assertRaises(PopTimeout):
+            queue.pop(timeout=0.01)
+        with self.assertRaises(KeyError):
+            queue.pop_many(3, timeout=0)
+
+    def test_producers_and_consumers(self):
+        queue = ConcurrentPriorityQueue()
+        consumed = produce_and_consume(lambda item: queue.push(item, item),
+                                       lambda: queue.pop_many(10, timeout=0.05), PopTimeout)
+        assert sorted(consumed) == list(range(4000))
+
+
+class TestAsyncPriorityQueue(AsyncTestCase):
+    def test_pop_waits_for_push(self):
+        async def scenario():
+            queue = AsyncPriorityQueue()
+            waiting_pops = [asyncio.ensure_future(queue.pop()) for _ in range(2)]
+            await asyncio.sleep(0)
+            queue.push_many([("b", 2), ("a", 1)])
+            return await asyncio.gather(*waiting_pops)
+
+        assert self.run_coroutine(scenario()) == ["a", "b"]
+
+    def test_pop_many_and_timeout(self):
+        async def scenario():
+            queue = AsyncPriorityQueue()
+            queue.push_many({"a": 3, "b": 1, "c": 2})
+            items = await queue.pop_many(2)
+            assert await queue.pop(timeout=0.01) == "a"
+            try:
+                await queue.pop(timeout=0.01)
+            except PopTimeout:
+                return items
+            raise AssertionError("pop didn't time out")
+
+        assert self.run_coroutine(scenario()) == ["b", "c"]
+
+    def test_cancelled_pop_hands_over_its_wake_up(self):
+        async def scenario():
+            queue = AsyncPriorityQueue()
+            first, second = asyncio.ensure_future(queue.pop()), asyncio.ensure_future(queue.pop())
+            await asyncio.sleep(0)
+            queue.push("a", 1)
+            # first was woken up but is cancelled before it runs, so second must get the item
+            first.cancel()
+            return await asyncio.wait_for(second, 1)
+
+        assert self.run_coroutine(scenario()) == "a"
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from unittest import TestCase
+
+from data_structures.queues.concurrent_queue import AsyncQueue, ConcurrentQueue
+from data_structures.queues.queue import PopEmpty, QueueFull
+from data_structures.queues.tests.concurrency import AsyncTestCase, produce_and_consume
+
+
+class TestConcurrentQueue(TestCase):
+    def test_fifo_and_timeouts(self):
+        queue = ConcurrentQueue(capacity=3)
+        queue.enqueue_many([1, 2])
+        queue.enqueue(3)
+        with self.assertRaises(QueueFull):
+            queue.enqueue(4, timeout=0.01)
+        with self.assertRaises(ValueError):
+            queue.enqueue_many(range(4))
+        assert queue.deque() == 1
+        assert queue.deque_many(-1) == []
+        assert queue.deque_many(5) == [2, 3]
+        assert queue.is_empty()
+        with self.assertRaises(PopEmpty):
+            queue.deque(timeout=0)
+
+    def test_backpressure(self):
+        queue = ConcurrentQueue(capacity=4, typecode='q')
+        produced = threading.Event()
+
+        def produce():
+            for start in range(0, 1000, 4):
+                queue.enqueue_many(range(start, start + 4))
+            produced.set()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        consumed = []
+        while len(consumed) < 1000:
+            assert len(queue) <= 4
+            consumed.extend(queue.deque_many(3, timeout=1))
+        producer.join()
+        assert produced.is_set()
+        assert consumed == list(range(1000))
+
+    def test_producers_and_consumers(self):
+        queue = ConcurrentQueue(capacity=16)
+        consumed = produce_and_consume(queue.enqueue, lambda: queue.deque_many(10, timeout=0.05), PopEmpty)
+        assert sorted(consumed) == list(range(4000))
+
+
+class TestAsyncQueue(AsyncTestCase):
+    def test_deque_waits_for_enqueue(self):
+        async def scenario():
+            queue = AsyncQueue()
+            waiting = [asyncio.ensure_future(queue.deque()) for _ in range(2)]
+            await asyncio.sleep(0)
+            await queue.enqueue_many(["a", "b"])
+            return await asyncio.gather(*waiting)
+
+        assert self.run_coroutine(scenario()) == ["a", "b"]
+
+    def test_backpressure_and_timeouts(self):
+        async def scenario():
+            queue = AsyncQueue(capacity=2)
+            await queue.enqueue_many([1, 2])
+            blocked = asyncio.ensure_future(queue.enqueue(3))
+            await asyncio.sleep(0)
+            assert not blocked.done()
+            try:
+                await queue.enqueue(4, timeout=0.01)
+            except QueueFull:
+                pass
+            else:
+                raise AssertionError("enqueue didn't time out")
+            first = await queue.deque()
+            await blocked
+            values = await queue.deque_many(5)
+            try:
+                await queue.deque(timeout=0.01)
+            except PopEmpty:
+                return [first] + values
+            raise AssertionError("deque didn't time out")
+
+        assert self.run_coroutine(scenario()) == [1, 2, 3]
@@ -0,0 +1,160 @@
+import random
+from unittest import TestCase
+
+from data_structures.queues.priority_queue import MinHeap, IndexedMinHeap, DaryHeap, PairingHeap, \
+    PriorityQueue, get_heap_class
+
+
+class TestMinHeap(TestCase):
+    def test_entry(self):
+        heap = MinHeap()
+        heap.push("a", 3)
+        entry = heap.entry_finder["a"]
+        assert (entry.priority, entry.item) == (3, "a")
+        priority, _, item = entry
+        assert (priority, item) == (3, "a")
+
+    def test_compaction(self):
+        heap = MinHeap(compaction_threshold=0.5)
+        for round_number in range(100):
+            for item in range(100):
+                heap.push(item, (item * 7 + round_number) % 100)
+            # Stale entries never outnumber live ones by more than the threshold
+            assert len(heap._queue) <= len(heap) * 1.5 + MinHeap.COMPACTION_MIN_SIZE + 1
+        assert len(heap) == 100
+        assert sorted(heap.pop_all()) == list(range(100))
+
+    def test_pop_all_with_removed_entries(self):
+        heap = MinHeap.build([(i, i) for i in range(5)])
+        heap.remove_task(4)
+        assert heap.pop_all() == [0, 1, 2, 3]
+
+
+class TestMinHeapBulkOperations(TestCase):
+    def test_build_any_hashable(self):
+        heap = MinHeap.build({"c": 3, ("a", 1): 1, frozenset("b"): 2})
+        assert heap.pop_all() == [("a", 1), frozenset("b"), "c"]
+
+    def test_push_many(self):
+        for batch_size in (2, 500):
+            heap = MinHeap.build([(i, i) for i in range(100)])
+            heap.push_many([(i, -i) for i in range(100, 100 + batch_size)])
+            heap.push_many([(0, 1000)])
+            assert len(heap) == 100 + batch_size
+            expected = list(range(99 + batch_size, 99, -1)) + list(range(1, 100)) + [0]
+            assert heap.pop_all() == expected
+
+    def test_pop_n_and_peek_n(self):
+        heap = MinHeap.build([(i, (i * 7) % 10) for i in range(10)])
+        heap.remove_task(0)
+        assert heap.peek_n(3) == [3, 6, 9]
+        assert len(heap) == 9
+        assert heap.pop_n(3) == [3, 6, 9]
+        assert heap.peek_n(100) == heap.pop_n(100) == [2, 5, 8, 1, 4, 7]
+
+    def test_merge(self):
+        heap = MinHeap.build([("a", 1), ("b", 5)])
+        other = MinHeap.build([("c", 3), ("b", 2), ("d", 3)])
+        heap.merge(other)
+        assert len(other) == 3
+        assert heap.pop_all() == ["a", "b", "c", "d"]
+
+
+class TestIndexedMinHeap(TestCase):
+    def test_build(self):
+        heap = IndexedMinHeap.build([(i, priority) for i, priority in enumerate([2, 1, 10, 4, 5])])
+        assert heap.peek() == 1
+        assert heap.pop_all() == [1, 0, 3, 4, 2]
+
+    def test_decrease_key(self):
+        heap = IndexedMinHeap.build([("a", 5), ("b", 3), ("c", 4)])
+        heap.push("a", 1)
+        assert len(heap) == 3
+        heap.push("b", 10)
+        assert heap.pop_all() == ["a", "c", "b"]
+
+    def test_remove_task(self):
+        heap = IndexedMinHeap.build([(i, i) for i in range(10)])
+        heap.remove_task(0)
+        heap.remove_task(5)
+        assert not heap.contains_item(5)
+        assert len(heap) == 8
+        assert heap.pop_all() == [1, 2, 3, 4, 6, 7, 8, 9]
+        with self.assertRaises(KeyError):
+            heap.remove_task(5)
+        with self.assertRaises(KeyError):
+            heap.pop()
+
+    def test_ties_keep_push_order(self):
+        heap = IndexedMinHeap()
+        for item in "abc":
+            heap.push(item, 1)
+        heap.push("a", 1)
+        assert heap.pop_all() == ["b", "c", "a"]
+
+    def test_matches_min_heap(self):
+        rng = random.Random(11)
+        indexed, reference = IndexedMinHeap(), MinHeap()
+        for _ in range(2000):
+            operation = rng.random()
+            item = rng.randrange(50)
+            if operation < 0.6:
+                priority = rng.randrange(100)
+                indexed.push(item, priority)
+                reference.push(item, priority)
+            elif operation < 0.8 and reference.contains_item(item):
+                indexed.remove_task(item)
+                reference.remove_task(item)
+            elif reference:
+                assert indexed.pop() == reference.pop()
+            assert len(indexed) == len(reference)
+        while reference:
+            assert indexed.pop() == reference.pop()
+        assert not indexed
+
+    def test_push_many(self):
+        heap = IndexedMinHeap.build([(i, i) for i in range(100)])
+        heap.push_many([(5, -1), (200, 50.5), (200, -2)])
+        heap.push_many([(i, i - 1000) for i in range(300, 400)])
+        assert len(heap) == 201
+        assert heap.pop_n(3) == [300, 301, 302]
+        assert heap.pop_all()[97:100] == [200, 5, 0]
+
+
+class TestHeapStrategies(TestCase):
+    strategies = (MinHeap, IndexedMinHeap, DaryHeap, PairingHeap)
+
+    def test_same_results(self):
+        rng = random.Random(13)
+        operations = [(rng.random(), rng.randrange(60), rng.randrange(100)) for _ in range(3000)]
+        results = []
+        for strategy in self.strategies:
+            heap = strategy()
+            popped = []
+            for operation, item, priority in operations:
+                if operation < 0.55:
+                    heap.push(item, priority)
+                elif operation < 0.7 and heap.contains_item(item):
+                    heap.remove_task(item)
+                elif operation < 0.8 and heap:
+                    popped.append(heap.peek())
+                elif heap:
+                    popped.append(heap.pop())
+            popped.extend(heap.pop_all())
+            results.append(popped)
+        assert all(result == results[0] for result in results)
+
+    def test_build(self):
+        for strategy in self.strategies:
+            heap = strategy.build([(i, priority) for i, priority in enumerate([2, 1, 10, 4, 5, 1])])
+            assert heap.pop_all() == [1, 5, 0, 3, 4, 2]
+
+    def test_get_heap_class(self):
+        assert get_heap_class('pairing') is PairingHeap
+        assert get_heap_class('binary', max_heap=True) is PriorityQueue
+        max_heap_class = get_heap_class('dary', max_heap=True)
+        assert max_heap_class is get_heap_class('dary', max_heap=True)
+        heap = max_heap_class.build([("a", 1), ("b", 3), ("c", 2)])
+        assert heap.pop_all() == ["b", "c", "a"]
+        with self.assertRaises(ValueError):
+            get_heap_class('fibonacci')
@@ -0,0 +1,64 @@
+from array import array
+from unittest import TestCase
+
+from data_structures.queues.queue import PopEmpty, Queue, QueueFull
+
+
+class TestQueue(TestCase):
+    def test_fifo_order_across_growth(self):
+        queue = Queue()
+        expected = list()
+        for value in range(50):
+            queue.enqueue(value)
+            expected.append(value)
+            if value % 3 == 0:
+                assert queue.deque() == expected.pop(0)
+        assert len(queue) == len(expected)
+        assert [queue.deque() for _ in range(len(queue))] == expected
+        assert queue.is_empty()
+        self.assertRaises(PopEmpty, queue.deque)
+
+    def test_batches_wrap_around(self):
+        queue = Queue()
+        queue.enqueue_many(range(6))
+        assert queue.deque_many(4) == [0, 1, 2, 3]
+        # Wraps around the end of the 8 slot buffer
+        queue.enqueue_many(range(6, 12))
+        assert queue.deque_many(100) == list(range(4, 12))
+        assert queue.deque_many(1) == []
+
+    def test_deque_many_not_positive(self):
+        queue = Queue()
+        queue.enqueue_many([1, 2])
+        assert queue.deque_many(-1) == []
+        assert queue.deque_many(0) == []
+        assert len(queue) == 2
+        queue.enqueue(3)
+        assert queue.deque_many(3) == [1, 2, 3]
+
+    def test_capacity(self):
+        queue = Queue(capacity=3)
+        queue.enqueue_many("ab")
+        self.assertRaises(QueueFull, queue.enqueue_many, "cd")
+        assert len(queue) == 2
+        queue.enqueue("c")
+        self.assertRaises(QueueFull, queue.enqueue, "d")
+        assert queue.deque() == "a"
+        queue.enqueue("d")
+        assert queue.deque_many(3) == ["b", "c", "d"]
+
+    def test_large_capacity_grows_on_demand(self):
+        queue = Queue(capacity=10 ** 7)
+        assert len(queue._buffer) == Queue.INITIAL_SIZE
+        queue.enqueue_many(range(20))
+        assert len(queue._buffer) == 32
+        assert queue.deque_many(20) == list(range(20))
+
+    def test_typed(self):
+        queue = Queue(typecode='d')
+        queue.enqueue_many([0.5] * 10)
+        queue.enqueue(2)
+        assert queue.deque() == 0.5
+        values = queue.deque_many(20)
+        assert values == array('d', [0.5] * 9 + [2.0])
+        self.assertRaises(TypeError, queue.enqueue, "a")
@@ -0,0 +1,42 @@
+import random
+from unittest import TestCase
+
+from data_structures.queues.top_k import TopK
+
+
+class TestTopK(TestCase):
+    def test_top_k(self):
+        top = TopK(3)
+        assert top.threshold is None
+        top.push_many([("a", 5), ("b", 1), ("c", 7), ("d", 3)])
+        assert len(top) == 3
+        assert "b" not in top
+        assert top.threshold == 3
+        assert top.push("e", 2) is False
+        assert top.push("f", 3) is False
+        assert top.snapshot() == [("c", 7), ("a", 5), ("d", 3)]
+        # Snapshots don't drain
+        assert len(top) == 3
+
+    def test_bottom_k(self):
+        bottom = TopK(2, largest=False)
+        bottom.push_many({"a": 5, "b": 1, "c": 7, "d": 3})
+        assert bottom.snapshot() == [("b", 1), ("d", 3)]
+        assert bottom.threshold == 3
+
+    def test_update_held_item(self):
+        top = TopK(2)
+        top.push_many([("a", 5), ("b", 6)])
+        assert top.push("a", 10) is True
+        assert top.threshold == 6
+        assert top.push("c", 7) is True
+        assert top.snapshot() == [("a", 10), ("c", 7)]
+        top.remove_task("a")
+        assert top.snapshot() == [("c", 7)]
+
+    def test_stream(self):
+        rng = random.Random(2)
+        stream = [(event, rng.random()) for event in range(5000)]
+        top = TopK(10)
+        top.push_many(stream)
+        assert top.snapshot() == sorted(stream, key=lambda pair: pair[1], reverse=True)[:10]
@@ -0,0 +1,84 @@
+from typing import Dict, Generic, List, Optional, Tuple
+
+from data_structures.queues.priority_queue import IndexedMinHeap, Priority, PriorityInput, T, _priority_pairs, \
+    get_heap_class
+
+
+class TopK(Generic[T]):
+    """ Keeps the k items with the highest (or lowest) priorities seen in a stream
+
+        The held items live in an indexed heap with the worst of them at the root, so memory is bounded by k.
+        Once k items are held, an item that isn't strictly better than the root is rejected in O(1), otherwise it
+        evicts the root in O(log(k)). Pushing an item that is already held updates its priority in place.
+
+        Note that an item whose priority drops while held stays held, as the items rejected earlier are gone.
+    """
+
+    def __init__(self, k: int, largest: bool = True) -> None:
+        """ Constructor
+
+        :param k: Maximum number of items to hold
+        :param largest: Keep the highest priorities, otherwise keep the lowest ones
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self.largest = largest
+        # The root must be the worst held item: the lowest priority when keeping the largest ones
+        self._heap = IndexedMinHeap() if largest else get_heap_class('indexed', max_heap=True)()
+        self._priorities = dict()  # type: Dict[T, Priority]
+
+    def __len__(self) -> int:
+        return len(self._priorities)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._priorities
+
+    @property
+    def threshold(self) -> Optional[Priority]:
+        """ Priority an item has to beat to get in, None while fewer than k items are held """
+        if len(self._priorities) < self.k:
+            return None
+        return self._priorities[self._heap.peek()]
+
+    def push(self, item: T, priority: Priority) -> bool:
+        """ Offers an item to the container
+
+        :param item: Item to offer, updated in place if it is already held
+        :param priority: the item's priority
+        :return: Returns True if the item is held after the push
+        """
+        priorities = self._priorities
+        if item not in priorities and len(priorities) >= self.k:
+            worst = priorities[self._heap.peek()]
+            if (priority <= worst) if self.largest else (priority >= worst):
+                return False
+            del priorities[self._heap.pop()]
+        priorities[item] = priority
+        self._heap.push(item, priority)
+        return True
+
+    def push_many(self, input_elements: PriorityInput) -> None:
+        """ Offers many items to the container
+
+        :param input_elements: Iterable of (item, priority) pairs or a dict mapping items to priorities
+        """
+        for item, priority in _priority_pairs(input_elements):
+            self.push(item, priority)
+
+    def remove_task(self, item: T) -> None:
+        """ Removes a held item
+
+        Raise KeyError if not found.
+
+        :param item: Item to remove
+        """
+        del self._priorities[item]
+        self._heap.remove_task(item)
+
+    def snapshot(self) -> List[Tuple[T, Priority]]:
+        """ Returns the held items best first without draining the container, O(k log(k))
+
+        :return: Returns a list of (item, priority) pairs
+        """
+        return sorted(self._priorities.items(), key=lambda pair: pair[1], reverse=self.largest)
@@ -1,47 +1,78 @@
-from typing import Any
-from data_structures.linked_lists.linked_list import Node
+from array import array
+from typing import Any, Iterable, List, Union
 
 
 class PopEmpty(Exception):
     pass
 
 
-class StackNode(Node):
-    def __init__(self, value):
-        self.before = None
-        super(StackNode, self).__init__(value)
+class Stack(object):
+    """ LIFO stack stored in a contiguous buffer, the top of the stack is the end of the buffer
 
+        With a typecode the buffer is an ``array.array`` of that type, which stores numbers unboxed and can be
+        exposed without copying through ``memoryview``. The buffer can't grow or shrink while a view of it is alive,
+        pushes and pops raise BufferError until the view is released.
 
-class Stack(object):
-    def __init__(self):
-        self._top = None
-        self._length = 0
+        Interface:
+            * push/push_many
+            * pop/pop_many
+            * peek
+            * is_empty
+            * memoryview
+    """
+
+    def __init__(self, typecode: str = None) -> None:
+        """ Constructor
+
+        :param typecode: array.array typecode of the items, None stores any python object
+        """
+        self.typecode = typecode
+        self._items = list() if typecode is None else array(typecode)  # type: Union[List[Any], array]
 
     def push(self, value: Any) -> None:
-        new_node = StackNode(value)
-        if self._top:
-            self._top.before = new_node
-        new_node.next = self._top
-        self._top = new_node
-        self._length += 1
+        self._items.append(value)
+
+    def push_many(self, values: Iterable[Any]) -> None:
+        """ Pushes many values, the last one ends up at the top
+
+        :param values: Values to push
+        """
+        self._items.extend(values)
 
     def pop(self) -> Any:
-        if not self._top:
+        if not self._items:
             raise PopEmpty
-        value = self._top.value
-        self._length -= 1
-        self._top = self._top.next
+        return self._items.pop()
 
-        if self._top:
-            self._top.before = None
+    def pop_many(self, n: int) -> Union[List[Any], array]:
+        """ Pops up to n values
 
-        return value
+        :param n: Maximum number of values to pop
+        :return: Returns the popped values top first, in an array.array of the stack's typecode in typed mode
+        """
+        items = self._items
+        start = max(len(items) - n, 0)
+        values = items[start:]
+        values.reverse()
+        del items[start:]
+        return values
 
     def is_empty(self):
-        return True if self._length == 0 else False
+        return True if len(self._items) == 0 else False
 
     def __len__(self):
-        return self._length
+        return len(self._items)
 
     def peek(self) -> Any:
-        return None if not self._top else self._top.value
+        return None if not self._items else self._items[-1]
+
+    def memoryview(self) -> memoryview:
+        """ Exposes the items without copying them, bottom first
+
+        Raise TypeError if the stack has no typecode
+
+        :return: Returns a memoryview of the buffer, release it before pushing or popping again
+        """
+        if self.typecode is None:
+            raise TypeError("Only stacks with a typecode can be exposed as a memoryview")
+        return memoryview(self._items)
@@ -0,0 +1,33 @@
+from array import array
+from unittest import TestCase
+
+from data_structures.stacks.stack import PopEmpty, Stack
+
+
+class TestStack(TestCase):
+    def test_push_pop(self):
+        stack = Stack()
+        assert stack.peek() is None
+        stack.push(1)
+        stack.push_many([2, 3, 4])
+        assert stack.peek() == 4
+        assert stack.pop() == 4
+        assert stack.pop_many(2) == [3, 2]
+        assert len(stack) == 1
+        assert stack.pop_many(5) == [1]
+        assert stack.is_empty()
+        assert stack.pop_many(1) == []
+        self.assertRaises(PopEmpty, stack.pop)
+        self.assertRaises(TypeError, stack.memoryview)
+
+    def test_typed(self):
+        stack = Stack(typecode='q')
+        stack.push_many(range(5))
+        view = stack.memoryview()
+        assert view.tolist() == [0, 1, 2, 3, 4]
+        # The view shares the buffer and blocks resizing until released
+        view[0] = 10
+        self.assertRaises(BufferError, stack.push, 5)
+        view.release()
+        assert stack.pop_many(5) == array('q', [4, 3, 2, 1, 10])
+        self.assertRaises(TypeError, stack.push, 0.5)
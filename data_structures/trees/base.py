@@ -1,5 +1,5 @@
-from collections import Sequence
-from typing import Any, Tuple, Union
+from collections.abc import Sequence
+from typing import Any, Iterator, Union
 from weakref import WeakKeyDictionary
 
 
@@ -16,59 +16,166 @@ class NodePtrDescriptor(object):
         self._values[instance] = value
 
 
+class ChildPtrDescriptor(NodePtrDescriptor):
+    """ Child pointer that keeps the subtree sizes of the node and of its ancestors up to date """
+
+    def __set__(self, instance, value):
+        old = self.__get__(instance, None)
+        super(ChildPtrDescriptor, self).__set__(instance, value)
+        delta = (value.size if value is not None else 0) - (old.size if old is not None else 0)
+        node = instance
+        while delta and node is not None:
+            node.size += delta
+            node = node.parent
+
+
 class BinaryNode(Sequence):
+    """ Node of a binary tree, also the sequence of the values of its subtree in order
+
+        Every node knows the size of its subtree, and setting a child updates the sizes of the node and of its
+        ancestors through the parent pointers. So len() is O(1) and indexing is O(h), where h is the height of the
+        subtree. A subtree must be detached from its parent before it is changed on its own.
+    """
     parent = NodePtrDescriptor()
-    left = NodePtrDescriptor()
-    right = NodePtrDescriptor()
+    left = ChildPtrDescriptor()
+    right = ChildPtrDescriptor()
 
     def __init__(self, data: Any, parent: "BinaryNode" = None,
                  left: "BinaryNode" = None, right: "BinaryNode" = None) -> None:
         self.data = data
+        self.size = 1
         self.left = left
         self.right = right
         self.parent = parent
 
-    def _search(self, count, index) -> Tuple["BinaryNode", int]:
-        found = None
-        # Check left
-        if self.left:
-            (found, count) = self.left._search(count, index)
-
-        # Check current Node
-        if count == index:
-            count += 1
-            return self, count
-        count += 1
-
-        # Check right
-        if not found and self.right is not None:
-            (found, count) = self.right._search(count, index)
-        return found, count
-
     def __getitem__(self, item):
-        found, _ = self._search(0, item)
-        if not found:
+        if not 0 <= item < self.size:
             raise IndexError('Index out of range')
-        return found.data
+        node = self
+        while True:
+            left_size = node.left.size if node.left is not None else 0
+            if item < left_size:
+                node = node.left
+            elif item == left_size:
+                return node.data
+            else:
+                item -= left_size + 1
+                node = node.right
 
     def __len__(self):
-        _, count = self._search(0, None)
-        return count
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Yields the values of the subtree in order, walking it without recursion """
+        stack = []
+        node = self
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
 
     def __repr__(self):
         return "Node({0})".format(self.data)
 
 
 class BinarySearchTree(Sequence):
+    """ Binary search tree, also the sequence of its values in order
+
+        The nodes keep their subtree sizes through insertions and deletions, so len() is O(1), and indexing and rank
+        are O(h), which is O(log(n)) while the tree stays balanced. Iteration is a linear in-order walk.
+    """
+
     def __init__(self, value):
         self.root = BinaryNode(value)
 
     def __len__(self):
-        return len(self.root)
+        return 0 if self.root is None else len(self.root)
 
     def __getitem__(self, item):
+        if self.root is None:
+            raise IndexError('Index out of range')
         return self.root[item]
 
+    def __iter__(self) -> Iterator[Any]:
+        return iter(()) if self.root is None else iter(self.root)
+
+    def __contains__(self, value):
+        return self.tree_search(value) is not None
+
+    def rank(self, value: Any) -> int:
+        """ Counts the values lower than value in O(h)
+
+        :param value: Value to rank, it doesn't need to be in the tree
+        :return: Returns the number of values lower than value
+        """
+        rank = 0
+        node = self.root
+        while node is not None:
+            if value <= node.data:
+                node = node.left
+            else:
+                rank += (node.left.size if node.left is not None else 0) + 1
+                node = node.right
+        return rank
+
+    def tree_insert(self, value: Any) -> BinaryNode:
+        """ Inserts value as a new leaf, after the values equal to it
+
+        :param value: Value to insert
+        :return: Returns the new node
+        """
+        parent = None
+        node = self.root
+        while node is not None:
+            parent = node
+            node = node.left if value < node.data else node.right
+
+        new_node = BinaryNode(value, parent=parent)
+        if parent is None:
+            self.root = new_node
+        elif value < parent.data:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        return new_node
+
+    def _transplant(self, old: BinaryNode, new: BinaryNode) -> None:
+        """ Replaces the subtree rooted at old with the one rooted at new """
+        if old.parent is None:
+            self.root = new
+        elif old is old.parent.left:
+            old.parent.left = new
+        else:
+            old.parent.right = new
+        if new is not None:
+            new.parent = old.parent
+
+    def tree_delete(self, bin_node: BinaryNode) -> None:
+        """ Removes a node of the tree
+
+        :param bin_node: Node to remove, it is left detached
+        """
+        if bin_node.left is None:
+            self._transplant(bin_node, bin_node.right)
+        elif bin_node.right is None:
+            self._transplant(bin_node, bin_node.left)
+        else:
+            successor = self.tree_minimum(bin_node.right)
+            if successor.parent is not bin_node:
+                self._transplant(successor, successor.right)
+                # Detached, so its new right subtree doesn't resize its old ancestors
+                successor.parent = None
+                successor.right = bin_node.right
+                successor.right.parent = successor
+            self._transplant(bin_node, successor)
+            successor.left = bin_node.left
+            successor.left.parent = successor
+        bin_node.parent = None
+        bin_node.left = bin_node.right = None
+
     @staticmethod
     def tree_minimum(bin_node: BinaryNode = None) -> BinaryNode:
         while bin_node.left is not None:
@@ -81,17 +188,12 @@ class BinarySearchTree(Sequence):
             bin_node = bin_node.right
         return bin_node
 
-    def tree_search(self, to_search: int) -> BinaryNode:
-
-        def recurse(bin_node: BinaryNode, value: int) -> Union[BinaryNode, None]:
-            if bin_node is None or value == bin_node.data:
-                return bin_node
-            if value < bin_node.data:
-                return recurse(bin_node.left, value)
-            else:
-                return recurse(bin_node.right, value)
-
-        return recurse(self.root, to_search)
+    def tree_search(self, to_search: int) -> Union[BinaryNode, None]:
+        """ Descends from the root with a loop in O(h), so degenerate trees don't hit the recursion limit """
+        bin_node = self.root
+        while bin_node is not None and to_search != bin_node.data:
+            bin_node = bin_node.left if to_search < bin_node.data else bin_node.right
+        return bin_node
 
     def in_order_tree_walk(self) -> None:
 
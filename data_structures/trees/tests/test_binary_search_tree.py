@@ -0,0 +1,62 @@
+import random
+from bisect import bisect_left, insort_right
+from unittest import TestCase
+
+from data_structures.trees.base import BinaryNode, BinarySearchTree
+
+
+class TestBinarySearchTree(TestCase):
+    def test_order_statistics(self):
+        tree = BinarySearchTree(5)
+        for value in [3, 8, 1, 4, 7, 9]:
+            tree.tree_insert(value)
+        assert len(tree) == 7
+        assert list(tree) == [1, 3, 4, 5, 7, 8, 9]
+        assert tree[0] == 1 and tree[4] == 7
+        assert tree.rank(6) == 4
+        assert 4 in tree and 6 not in tree
+        assert tree.index(8) == 5
+        with self.assertRaises(IndexError):
+            tree[7]
+
+        tree.tree_delete(tree.root)
+        assert list(tree) == [1, 3, 4, 7, 8, 9]
+        assert len(tree.root) == 6
+        tree.tree_delete(tree.tree_search(3))
+        assert [tree[index] for index in range(len(tree))] == [1, 4, 7, 8, 9]
+
+    def test_manual_links_keep_sizes(self):
+        root = BinaryNode(2, left=BinaryNode(1))
+        right = BinaryNode(4, left=BinaryNode(3))
+        root.right = right
+        right.parent = root
+        right.right = BinaryNode(5, parent=right)
+        assert len(root) == 5
+        assert list(root) == [1, 2, 3, 4, 5]
+
+    def test_matches_sorted_list(self):
+        rng = random.Random(11)
+        tree, expected = BinarySearchTree(250), [250]
+        for _ in range(2000):
+            value = rng.randrange(500)
+            if rng.random() < 0.6 or len(expected) < 2:
+                tree.tree_insert(value)
+                insort_right(expected, value)
+            elif value in expected:
+                tree.tree_delete(tree.tree_search(value))
+                expected.remove(value)
+            assert len(tree) == len(expected)
+        assert list(tree) == expected
+        assert [tree[index] for index in range(len(tree))] == expected
+        assert tree.rank(123) == bisect_left(expected, 123)
+
+    def test_degenerate_tree(self):
+        # Sorted inserts build a 3000 deep chain, deeper than the recursion limit
+        tree = BinarySearchTree(0)
+        for value in range(1, 3000):
+            tree.tree_insert(value)
+        assert 2999 in tree
+        assert 3000 not in tree
+        assert tree.tree_search(1500).data == 1500
+        assert len(tree) == 3000
+        assert tree[2999] == 2999
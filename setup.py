@@ -21,6 +21,9 @@ setup(
     keywords="python data structures list queue binary search tree graph",
     url="https://github.com/goncalossantos/data_strutures",
     packages=find_packages(),
+    extras_require={
+        'numpy': ['numpy'],
+    },
     long_description=read('README.md'),
     classifiers=[
         "Development Status :: 3 - Alpha",